@@ -1,6 +1,31 @@
 from .bootstrap import *
-from .language import transl, setLang, translator
-from .core import LogProcessor
-from .ui import LogDisplayWidget, OscSettingsWidget, GameStatusWidget, GeneratorStatusWidget
+from .language import transl, current_language, translator, set_language
+from .core import (
+    LogProcessor,
+    LogTailer,
+    OscSender,
+    SessionHistory,
+    Metrics,
+    osc_parameters,
+)
 from .utils import LOG_PATTERNS
 from .resources import SLASHERS, GAME_MAPS, parse_items, GetProgressColor
+
+# 視窗元件與只在特定模式使用的服務, 第一次取用時才匯入 (無介面模式不會載入 QtWidgets / QtGui)
+LAZY_EXPORTS = {
+    "MetricsServer": "core",
+    "OverlayServer": "core",
+    "HeadlessDaemon": "core",
+    "LogDisplayWidget": "ui",
+    "OscSettingsWidget": "ui",
+    "GameStatusWidget": "ui",
+    "GeneratorStatusWidget": "ui",
+    "MetricsPanelWidget": "ui",
+}
+
+
+def __getattr__(name: str):
+    package = LAZY_EXPORTS.get(name)
+    if package is None:
+        return load_gui_class(name)
+    return getattr(import_module(f"{__name__}.{package}"), name)
@@ -1,2 +1,3 @@
 from .libs import *
 from .config import *
+from .libs import __getattr__  # QtWidgets / QtGui 類別延遲匯入 (見 libs.GUI_CLASSES)
@@ -1,9 +1,33 @@
-from .libs import Path
+from .libs import sys, Path, QStandardPaths
 
 # 資源 URL (如果下載完整項目，可以改成本地讀取 Path(__file__).parent.parent / "resources/img")
 ASSETS = "https://github.com/Canaan-HS/SlashcoSense-VRC/raw/refs/heads/main/Modules/resources/img"
 
 DEFAULT_OSC_PORT = 9000  # 預設埠號
-LOG_UPDATE_INTERVAL = 500  # 日誌更新間隔 (毫秒)
+LOG_UPDATE_INTERVAL = 500  # 日誌更新間隔 (毫秒), 無法使用檔案變更通知時的輪詢間隔
+LOG_WATCH_SAFETY_INTERVAL = 2000  # 確實收到檔案變更通知後的保底輪詢間隔 (毫秒)
+LOG_READ_CHUNK_SIZE = 1 << 20  # 日誌分塊讀取大小 (位元組)
+LOG_READ_MAX_PER_TICK = 8 << 20  # 單次處理最多讀取的位元組數, 超過時讓出事件循環後繼續
+LOG_LINE_BUFFER_LIMIT = 4 << 20  # 未寫完的單行最多緩衝的位元組數, 超過時直接解析已讀到的部分
+LOG_CHECKPOINT_INTERVAL = 5000  # 定期保存讀取位置與對局狀態的間隔 (毫秒)
+LOG_CATCH_UP_BLOCK_SIZE = 1 << 20  # 啟動時從檔尾反向搜尋最近一局的區塊大小 (位元組)
+LOG_DISPLAY_MAX_LINES = 2000  # 日誌面板最多保留的行數
+LOG_DISPLAY_FLUSH_INTERVAL = 100  # 日誌面板合併寫入的間隔 (毫秒)
+OVERLAY_PORT = 8765  # 無介面模式的本機 WebSocket / HTTP 埠號 (疊加層、第二螢幕)
+OVERLAY_MAX_BUFFER = 1 << 20  # 單一訂閱者未送出的資料上限 (位元組), 超過時視為卡住並中斷連線
+METRICS_REFRESH_INTERVAL = 1000  # 偵錯面板的效能指標更新間隔 (毫秒)
+PROGRESS_ANIMATION_DURATION = 200  # 發電機進度條填充動畫時間 (毫秒), 設為 0 則直接跳到新數值
 WINDOWS_ICON_URL = f"{ASSETS}/SlashCo.ico"  # 窗口圖標
 VRC_LOG_DIR = Path.home() / "AppData/LocalLow/VRChat/VRChat"  # VRChat 日誌目錄
+
+# 本機資料目錄 (快取等)
+APP_DATA_DIR = (
+    Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation))
+    / "SlashcoSense"
+)
+IMAGE_CACHE_DIR = APP_DATA_DIR / "cache/img"  # 圖片磁碟快取
+HISTORY_DB_PATH = APP_DATA_DIR / "history.sqlite3"  # 對局歷史紀錄
+LOG_CHECKPOINT_PATH = APP_DATA_DIR / "checkpoint.json"  # 讀取位置與對局狀態, 重新啟動時接續
+HEADLESS_CHECKPOINT_PATH = APP_DATA_DIR / "checkpoint_headless.json"  # 無介面模式的檢查點
+# 內建圖片, 離線時使用
+LOCAL_IMG_DIR = Path(getattr(sys, "_MEIPASS", Path(__file__).parent.parent.parent)) / "IMG"
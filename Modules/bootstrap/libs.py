@@ -1,41 +1,112 @@
 import os
 import re
 import sys
+import json
+import mmap
+import time
 import locale
 import ctypes
+import signal
+import socket
+import sqlite3
+import argparse
 import platform
+import threading
 
+from enum import IntEnum
 from pathlib import Path
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Optional, Any, TYPE_CHECKING
-
-from PySide6.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
-    QLabel,
-    QProgressBar,
-    QTextEdit,
-    QCheckBox,
-    QLineEdit,
-    QGroupBox,
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Optional, Any, BinaryIO, Callable
+
+from PySide6.QtCore import (
+    Qt,
+    QUrl,
+    QSize,
+    QRectF,
+    QTimer,
+    QEvent,
+    Signal,
+    QThread,
+    QObject,
+    QByteArray,
+    QEasingCurve,
+    QStandardPaths,
+    QCoreApplication,
+    QVariantAnimation,
+    QCryptographicHash,
+    QFileSystemWatcher,
 )
-from PySide6.QtCore import Qt, QUrl, QSize, QTimer, Signal, QThread, QObject
-from PySide6.QtGui import QFont, QIcon, QCursor, QPixmap, QPainter, QPixmapCache, QPainterPath
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-
-# 避免可能出現的錯誤, 事先初始化一些全域變數
-udp_client = None
-SimpleUDPClient = None
-UDP_CLIENT_AVAILABLE = False
-
-try:
-    from pythonosc import udp_client
-    UDP_CLIENT_AVAILABLE = True
-except ImportError:
-    pass
-
-if TYPE_CHECKING:
-    from pythonosc.udp_client import SimpleUDPClient
+
+# 視窗相關的 Qt 類別 (QtWidgets / QtGui) 第一次取用時才匯入, 無介面模式不會載入
+GUI_CLASSES = {
+    **dict.fromkeys(
+        (
+            "QApplication",
+            "QMainWindow",
+            "QWidget",
+            "QVBoxLayout",
+            "QHBoxLayout",
+            "QLabel",
+            "QPlainTextEdit",
+            "QCheckBox",
+            "QComboBox",
+            "QLineEdit",
+            "QGroupBox",
+        ),
+        "PySide6.QtWidgets",
+    ),
+    **dict.fromkeys(
+        (
+            "QPen",
+            "QFont",
+            "QIcon",
+            "QBrush",
+            "QColor",
+            "QImage",
+            "QCursor",
+            "QPixmap",
+            "QPainter",
+            "QPainterPath",
+        ),
+        "PySide6.QtGui",
+    ),
+}
+
+
+def load_gui_class(name: str):
+    """(模組層級 __getattr__) 依名稱匯入 QtWidgets / QtGui 的類別"""
+    module = GUI_CLASSES.get(name)
+    if module is None:
+        raise AttributeError(name)
+    return getattr(import_module(module), name)
+
+
+__getattr__ = load_gui_class
+
+# 可選 / 非啟動必要的模組延遲載入, 縮短首次開啟視窗的時間
+UDP_CLIENT_AVAILABLE = find_spec("pythonosc") is not None
+
+
+def load_pythonosc():
+    """啟用 OSC 時才載入 pythonosc (其依賴 asyncio, 匯入成本高)"""
+    from pythonosc import udp_client, osc_bundle_builder, osc_message_builder
+
+    return udp_client, osc_bundle_builder, osc_message_builder
+
+
+def load_qt_network():
+    """需要下載圖片時才載入 QtNetwork"""
+    from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+    return QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+
+def load_asyncio():
+    """無介面模式啟動疊加層伺服器時才載入 asyncio"""
+    import asyncio
+
+    return asyncio
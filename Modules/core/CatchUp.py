@@ -0,0 +1,74 @@
+from ..bootstrap import os, BinaryIO, LOG_CATCH_UP_BLOCK_SIZE
+
+ROUND_START_MARKER = b"Generators reset."  # 每局初始化 (init)
+ROUND_INFO_MARKER = b"Played Map:"  # 找不到初始化時, 退而使用最近的對局資訊
+TIMESTAMP_SIZE = len(b"YYYY.MM.DD hh:mm:ss")  # 行首時間戳的長度
+
+
+def _line_start(handle: BinaryIO, position: int, block_size: int = 4096) -> int:
+    """由指定位置往前找到所在行的開頭"""
+    while position > 0:
+        start = max(0, position - block_size)
+        handle.seek(start)
+        index = handle.read(position - start).rfind(b"\n")
+        if index >= 0:
+            return start + index + 1
+        position = start
+    return 0
+
+
+def _include_round_info(handle: BinaryIO, init_start: int) -> int:
+    """
+    對局資訊可能與初始化行同一秒且寫在它之前 (時間戳相同仍屬於該局)
+    往前檢查同一秒的行, 有對局資訊時從最早的一行開始解析
+    """
+    handle.seek(init_start)
+    stamp = handle.read(TIMESTAMP_SIZE)
+    if len(stamp) < TIMESTAMP_SIZE:
+        return init_start
+
+    start = position = init_start
+    while position > 0:
+        previous = _line_start(handle, position - 1)
+        handle.seek(previous)
+        line = handle.read(position - previous)
+        if not line.startswith(stamp):
+            break
+        if ROUND_INFO_MARKER in line:
+            start = previous
+        position = previous
+    return start
+
+
+def find_round_start(handle: BinaryIO, block_size: int = LOG_CATCH_UP_BLOCK_SIZE) -> int:
+    """
+    從檔尾反向分塊搜尋最近一局的初始化行, 回傳解析起點的位元組位置
+    該局的地圖 / 殺手 / 物品與發電機資訊都在初始化之後 (或與它同一秒), 只需從這裡往後解析
+    """
+    handle.seek(0, os.SEEK_END)
+    end = handle.tell()
+
+    overlap = max(len(ROUND_START_MARKER), len(ROUND_INFO_MARKER)) - 1
+    position = end
+    tail = b""
+    fallback = None
+
+    while position > 0:
+        start = max(0, position - block_size)
+        handle.seek(start)
+        block = handle.read(position - start) + tail  # 保留重疊部分, 避免關鍵字被區塊切斷
+
+        index = block.rfind(ROUND_START_MARKER)
+        if index >= 0:
+            return _include_round_info(handle, _line_start(handle, start + index))
+
+        if fallback is None:
+            index = block.rfind(ROUND_INFO_MARKER)
+            if index >= 0:
+                fallback = _line_start(handle, start + index)
+
+        tail = block[:overlap]
+        position = start
+
+    # 沒有任何對局時, 跳到最後一行開頭 (可能尚未寫完)
+    return fallback if fallback is not None else _line_start(handle, end)
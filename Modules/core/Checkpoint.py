@@ -0,0 +1,41 @@
+from ..bootstrap import os, json, Path, BinaryIO, Optional
+
+IDENTITY_HEAD_SIZE = 256  # 以檔案開頭內容辨識同一個日誌 (開頭含 VRChat 啟動時間)
+
+
+def file_identity(handle: BinaryIO) -> dict:
+    """檔案識別資訊: inode (Windows 為檔案索引) 與開頭內容"""
+    position = handle.tell()
+    handle.seek(0)
+    head = handle.read(IDENTITY_HEAD_SIZE)
+    handle.seek(position)
+    return {"inode": os.fstat(handle.fileno()).st_ino, "head": head.hex()}
+
+
+def same_file(handle: BinaryIO, identity: dict) -> bool:
+    """比對檢查點記錄的檔案是否仍是同一個 (重建或被覆寫時開頭內容會不同)"""
+    head = bytes.fromhex(identity["head"])
+
+    position = handle.tell()
+    handle.seek(0)
+    current = handle.read(len(head))
+    handle.seek(position)
+    return current == head and os.fstat(handle.fileno()).st_ino == identity["inode"]
+
+
+def load_checkpoint(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def save_checkpoint(path: Path, checkpoint: dict):
+    """先寫入暫存檔再取代, 避免中途關閉留下不完整的檢查點"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(".tmp")
+        temp.write_text(json.dumps(checkpoint), encoding="utf-8")
+        temp.replace(path)
+    except OSError:
+        pass
@@ -0,0 +1,98 @@
+from .LogTailer import LogTailer
+from .LogProcessor import LogProcessor
+from .OverlayServer import OverlayServer
+from .OscSender import OscSender, osc_parameters
+from ..resources import parse_items
+from ..bootstrap import (
+    Any,
+    Path,
+    QObject,
+    Optional,
+    datetime,
+    OVERLAY_PORT,
+    HEADLESS_CHECKPOINT_PATH,
+)
+
+
+class HeadlessDaemon(QObject):
+    """
+    無介面模式: 不建立任何視窗元件, 日誌監控直接在主執行緒的事件循環執行
+    對局狀態以差異推送給本機疊加層 (OverlayServer), 可選擇同時送出 OSC
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        port: int = OVERLAY_PORT,
+        osc_port: int = 0,
+        checkpoint_path: Optional[Path] = HEADLESS_CHECKPOINT_PATH,
+    ):
+        super().__init__()
+        self.state: dict[str, Any] = {}  # 已推送的狀態, 只送出有變化的欄位
+
+        # 埠號被占用時直接拋出, 由呼叫端結束程式
+        self.server = OverlayServer(port)
+        self.osc_sender = OscSender("127.0.0.1", osc_port) if osc_port else None
+
+        self.log_processor = LogProcessor(
+            log_dir, batch_signals=True, checkpoint_path=checkpoint_path
+        )
+        self.log_processor.events_batched.connect(self._on_events_batched)
+        self.log_tailer = LogTailer([self.log_processor])
+
+        self._handlers = {
+            "log_message_generated": lambda _changes, message: self._log(message),
+            "game_info_updated": self._on_game_info_updated,
+            "session_info_updated": lambda _changes, _session_key: None,
+            "generator_updated": self._on_generator_updated,
+            "generators_reset": self._on_generators_reset,
+        }
+
+    def start(self):
+        self._log(f"Overlay: http://127.0.0.1:{self.server.port}/")
+        self.log_tailer.run()
+
+    def close(self):
+        self.log_tailer.stop()
+        self.log_tailer.close()
+        if self.osc_sender:
+            self.osc_sender.close()
+        self.server.close()
+
+    def _on_events_batched(self, events: list, _emitted_at: float):
+        """一個處理週期的事件合併為一次狀態差異與一個 OSC 封包"""
+        changes = {}
+        for name, args in events:
+            self._handlers[name](changes, *args)
+            if self.osc_sender:
+                for param, value in osc_parameters(name, args):
+                    self.osc_sender.send(param, value)
+
+        changes = {key: value for key, value in changes.items() if self.state.get(key) != value}
+        if changes:
+            self.state.update(changes)
+            self.server.publish(changes)
+
+        if self.osc_sender:
+            self.osc_sender.flush()
+
+    def _log(self, message: str):
+        print(f"{datetime.now().strftime('[%H:%M:%S]')} {message}", flush=True)
+
+    def _on_game_info_updated(
+        self, changes: dict, map_name: str, slasher_name: str, slasher_icon: str, slasher_id: int
+    ):
+        changes["map"] = map_name
+        changes["slasher"] = slasher_name
+        changes["slasher_id"] = slasher_id
+        changes["slasher_icon"] = slasher_icon
+        if self.log_processor.game_info:
+            changes["items"] = parse_items(self.log_processor.game_info[2])
+
+    def _on_generator_updated(self, changes: dict, gen_index: int, var_type: str, new_value: Any):
+        changes[f"generator{gen_index}_{var_type.lower()}"] = new_value
+
+    def _on_generators_reset(self, changes: dict):
+        for key in self.state.keys() | changes.keys():
+            if key.startswith("generator"):
+                changes[key] = None
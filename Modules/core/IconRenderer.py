@@ -0,0 +1,122 @@
+from ..bootstrap import (
+    Qt,
+    QSize,
+    Signal,
+    QImage,
+    QThread,
+    QObject,
+    QPixmap,
+    QPainter,
+    Optional,
+    QByteArray,
+    QPainterPath,
+)
+
+
+class _RenderWorker(QObject):
+    """在背景執行緒解碼與縮放 (只使用 QImage, 不接觸 QPixmap)"""
+
+    rendered = Signal(int, QImage)  # 請求編號, 已完成的圓角圖片
+
+    def render(
+        self, request_id: int, data: QByteArray, size: QSize, radius: int, dpr: float, crop: bool
+    ):
+        image = QImage.fromData(data)
+        if image.isNull():
+            self.rendered.emit(request_id, QImage())
+            return
+
+        if crop:
+            # 裁出中心正方形
+            side = min(image.width(), image.height())
+            image = image.copy(
+                (image.width() - side) // 2, (image.height() - side) // 2, side, side
+            )
+
+        # 依裝置像素比縮放至實際像素大小
+        target = size * dpr
+        scaled = image.scaled(
+            target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+
+        rounded = QImage(scaled.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        rounded.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(0, 0, scaled.width(), scaled.height(), radius * dpr, radius * dpr)
+        painter.setClipPath(path)
+        painter.drawImage(0, 0, scaled)
+        painter.end()
+
+        rounded.setDevicePixelRatio(dpr)
+        self.rendered.emit(request_id, rounded)
+
+
+class IconRenderer(QObject):
+    """
+    預先渲染的圓角圖片快取, 以 (來源, 尺寸, 圓角, 裝置像素比, 是否裁切) 為鍵
+    解碼與縮放在背景執行緒完成, GUI 執行緒只負責將完成的圖片換上
+    """
+
+    icon_ready = Signal(object, QPixmap)  # 快取鍵, 渲染完成的圖片
+    icon_failed = Signal(object)
+
+    _render_requested = Signal(int, QByteArray, QSize, int, float, bool)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.pixmaps: dict[tuple, QPixmap] = {}
+        self.pending: dict[int, tuple] = {}  # 請求編號 -> 快取鍵
+        self.next_id = 0
+
+        self.render_thread = QThread(self)
+        self.worker = _RenderWorker()
+        self.worker.moveToThread(self.render_thread)
+        self.render_thread.finished.connect(self.worker.deleteLater)
+
+        self._render_requested.connect(self.worker.render)
+        self.worker.rendered.connect(self._on_rendered)
+        self.render_thread.start()
+
+    @staticmethod
+    def key(source: str, size: QSize, radius: int, dpr: float, crop: bool = False) -> tuple:
+        return (source, size.width(), size.height(), radius, dpr, crop)
+
+    def find(self, key: tuple) -> Optional[QPixmap]:
+        return self.pixmaps.get(key)
+
+    def request(self, key: tuple, data: QByteArray):
+        """排入背景渲染, 已有快取或正在渲染時不重複處理"""
+        if key in self.pixmaps or key in self.pending.values():
+            return
+
+        source, width, height, radius, dpr, crop = key
+        self.next_id += 1
+        self.pending[self.next_id] = key
+        self._render_requested.emit(self.next_id, data, QSize(width, height), radius, dpr, crop)
+
+    def invalidate(self, source: str):
+        """來源內容有更新時, 移除該來源所有尺寸的快取與尚未完成的渲染"""
+        for key in [key for key in self.pixmaps if key[0] == source]:
+            del self.pixmaps[key]
+        for request_id in [rid for rid, key in self.pending.items() if key[0] == source]:
+            del self.pending[request_id]
+
+    def _on_rendered(self, request_id: int, image: QImage):
+        key = self.pending.pop(request_id, None)
+        if key is None:
+            return  # 已被 invalidate 的過期結果
+
+        if image.isNull():
+            self.icon_failed.emit(key)
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self.pixmaps[key] = pixmap
+        self.icon_ready.emit(key, pixmap)
+
+    def close(self):
+        self.render_thread.quit()
+        self.render_thread.wait()
@@ -0,0 +1,173 @@
+from ..bootstrap import (
+    re,
+    json,
+    Path,
+    QUrl,
+    QObject,
+    Signal,
+    Optional,
+    QByteArray,
+    load_qt_network,
+    IMAGE_CACHE_DIR,
+    LOCAL_IMG_DIR,
+)
+
+
+class ImageCache(QObject):
+    """
+    圖片快取: 記憶體 -> 磁碟快取 -> 專案內建 IMG 的順序取得圖片, 只有都沒有時才等待網路
+    磁碟快取以 URL 為鍵, 並保存 ETag / Last-Modified 供背景預取時驗證是否有更新
+    """
+
+    image_ready = Signal(str, QByteArray)  # url, 圖片資料 (下載完成或內容有更新)
+    image_failed = Signal(str)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        cache_dir: Path = IMAGE_CACHE_DIR,
+        fallback_dir: Path = LOCAL_IMG_DIR,
+    ):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self.fallback_dir = fallback_dir
+        self.index_path = cache_dir / "index.json"
+
+        self.memory: dict[str, QByteArray] = {}
+        self.index: dict[str, dict] = self._load_index()  # url -> {"file", "etag", "last_modified"}
+        self.waiting: set[str] = set()  # 呼叫端正在等待的 url (預取時也需要通知)
+        self.in_flight: set[str] = set()
+
+        self.network_manager = None  # 第一次需要下載時才建立 (延遲載入 QtNetwork)
+
+    def _load_index(self) -> dict:
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp = self.index_path.with_suffix(".tmp")
+            temp.write_text(json.dumps(self.index, indent=2), encoding="utf-8")
+            temp.replace(self.index_path)
+        except OSError:
+            pass
+
+    def _file_name(self, url: str) -> str:
+        """以 URL 檔名作為快取檔名, 與其他 URL 衝突時改用完整 URL 轉換的名稱"""
+        name = Path(QUrl(url).path()).name or "image"
+        used = {entry["file"] for key, entry in self.index.items() if key != url}
+        if name in used:
+            name = re.sub(r"[^\w.-]", "_", url)[-150:]
+        return name
+
+    def get(self, url: str) -> Optional[QByteArray]:
+        """立即取得本機已有的圖片, 沒有則回傳 None"""
+        data = self.memory.get(url)
+        if data is not None:
+            return data
+
+        candidates = []
+        if not url.startswith("http"):
+            candidates.append(Path(url))  # ASSETS 設為本機路徑時直接讀取
+        if url in self.index:
+            candidates.append(self.cache_dir / self.index[url]["file"])
+        candidates.append(self.fallback_dir / Path(QUrl(url).path()).name)
+
+        for path in candidates:
+            try:
+                if path.is_file():
+                    data = QByteArray(path.read_bytes())
+                    self.memory[url] = data
+                    return data
+            except OSError:
+                continue
+
+        return None
+
+    def fetch(self, url: str):
+        """從網路取得圖片, 完成後發出 image_ready 或 image_failed"""
+        self.waiting.add(url)
+        self._request(url)
+
+    def prefetch(self, urls: list[str]):
+        """背景並行驗證 / 下載所有圖片, 只有內容有更新時才會發出 image_ready"""
+        for url in dict.fromkeys(urls):
+            if url and url.startswith("http"):
+                self._request(url)
+
+    def _request(self, url: str):
+        if url in self.in_flight:
+            return
+        self.in_flight.add(url)
+
+        QNetworkAccessManager, QNetworkRequest, _ = load_qt_network()
+        if self.network_manager is None:
+            # QNetworkAccessManager 會對同一主機並行多個請求
+            self.network_manager = QNetworkAccessManager(self)
+            self.network_manager.finished.connect(self._on_finished)
+
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.Attribute.User, url)
+
+        # 已有快取時帶上驗證資訊, 沒有更新時伺服器只回 304
+        entry = self.index.get(url)
+        if entry and (self.cache_dir / entry["file"]).is_file():
+            if entry.get("etag"):
+                request.setRawHeader(
+                    QByteArray(b"If-None-Match"), QByteArray(entry["etag"].encode())
+                )
+            if entry.get("last_modified"):
+                request.setRawHeader(
+                    QByteArray(b"If-Modified-Since"), QByteArray(entry["last_modified"].encode())
+                )
+
+        self.network_manager.get(request)
+
+    def _on_finished(self, reply):
+        _, QNetworkRequest, QNetworkReply = load_qt_network()
+        url = reply.request().attribute(QNetworkRequest.Attribute.User)
+        self.in_flight.discard(url)
+        waiting = url in self.waiting
+        self.waiting.discard(url)
+
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        data = None
+
+        if reply.error() == QNetworkReply.NetworkError.NoError and status != 304:
+            data = reply.readAll()
+            if not data.isEmpty():
+                self._store(url, reply, data)
+            else:
+                data = None
+
+        reply.deleteLater()
+
+        if data is not None:
+            self.image_ready.emit(url, data)
+        elif waiting:
+            # 304 或離線時改用本機已有的版本
+            data = self.get(url)
+            if data is not None:
+                self.image_ready.emit(url, data)
+            else:
+                self.image_failed.emit(url)
+
+    def _store(self, url: str, reply, data: QByteArray):
+        self.memory[url] = data
+
+        entry = {
+            "file": self._file_name(url),
+            "etag": reply.rawHeader("ETag").toStdString(),
+            "last_modified": reply.rawHeader("Last-Modified").toStdString(),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / entry["file"]).write_bytes(bytes(data))
+        except OSError:
+            return
+
+        self.index[url] = entry
+        self._save_index()
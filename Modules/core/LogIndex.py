@@ -0,0 +1,55 @@
+from ..bootstrap import os, Path, Optional
+
+
+class LogDirectoryIndex:
+    """日誌目錄索引, 快取候選日誌與其修改時間, 只在目錄本身變更時重新掃描"""
+
+    def __init__(self, log_dir: Path, prefix: str = "output_log_", suffix: str = ".txt"):
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.suffix = suffix
+
+        self.files: dict[str, float] = {}
+        self.dir_mtime: Optional[int] = None  # None 表示下次必定重新掃描
+
+    def invalidate(self):
+        """收到目錄變更通知時呼叫"""
+        self.dir_mtime = None
+
+    def refresh(self) -> list[Path]:
+        """目錄有變更時重新掃描, 回傳新出現的日誌 (依修改時間由舊到新)"""
+        try:
+            dir_mtime = os.stat(self.log_dir).st_mtime_ns
+        except OSError:
+            self.files.clear()
+            self.dir_mtime = None
+            return []
+
+        if dir_mtime == self.dir_mtime:
+            return []
+
+        files = {}
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(self.prefix) and name.endswith(self.suffix):
+                    try:
+                        if entry.is_file():
+                            files[name] = entry.stat().st_mtime
+                    except OSError:
+                        continue
+
+        added = sorted((name for name in files if name not in self.files), key=files.get)
+        self.files = files
+        self.dir_mtime = dir_mtime
+
+        return [self.log_dir / name for name in added]
+
+    def latest(self) -> Optional[Path]:
+        """索引中修改時間最新的日誌"""
+        if not self.files:
+            return None
+        return self.log_dir / max(self.files, key=self.files.get)
+
+    def __contains__(self, path: Path) -> bool:
+        return path.name in self.files
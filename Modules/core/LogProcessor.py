@@ -1,142 +1,407 @@
 from ..language import transl
-from ..utils import LOG_PATTERNS
+from ..utils import EventKind, match_log_content
+from .LogIndex import LogDirectoryIndex
+from .CatchUp import find_round_start
+from .SessionHistory import SessionHistory
+from .Metrics import Metrics
+from .Checkpoint import file_identity, same_file, load_checkpoint, save_checkpoint
 from ..resources import GAME_MAPS, SLASHERS, parse_items
-from ..bootstrap import Path, QThread, QObject, Optional, Signal, LOG_UPDATE_INTERVAL
+from ..bootstrap import (
+    os,
+    time,
+    Path,
+    QTimer,
+    QObject,
+    Optional,
+    Signal,
+    LOG_READ_CHUNK_SIZE,
+    LOG_READ_MAX_PER_TICK,
+    LOG_LINE_BUFFER_LIMIT,
+)
 
 
 class LogProcessor(QObject):
-    """日誌處理器，在獨立執行緒中運行"""
+    """日誌處理器 (每個 VRChat 實例一個), 由 LogTailer 在獨立執行緒中驅動"""
 
     # 定義信號，用於將處理結果傳遞給主線程
     log_message_generated = Signal(str)
     game_info_updated = Signal(str, str, str, int)
     session_info_updated = Signal(str)
-    generator_updated = Signal(str, str, str)
+    generator_updated = Signal(int, str, object)  # 發電機編號, 變數名稱, 新值 (int / bool)
     generators_reset = Signal()
+    # 批次模式: 每個處理週期一次送出 [(信號名稱, 參數)] 與送出時間 (perf_counter, 量測跨執行緒延遲)
+    events_batched = Signal(list, float)
 
-    def __init__(self, log_dir: Path):
+    def __init__(
+        self,
+        log_dir: Path,
+        batch_signals: bool = False,
+        history: Optional[SessionHistory] = None,
+        checkpoint_path: Optional[Path] = None,
+        metrics: Optional[Metrics] = None,
+    ):
         super().__init__()
-        self.log_dir = log_dir
+        # 指定單一日誌檔時只追蹤該檔案, 否則追蹤目錄內最新的日誌
+        self.pinned_file = log_dir if log_dir.suffix == ".txt" else None
+        self.log_dir = log_dir.parent if self.pinned_file else log_dir
+        self.log_index = LogDirectoryIndex(self.log_dir)
         self.current_log_file: Optional[Path] = None
+        self.log_handle = None
 
-        self.file_position = 0
-        self.process_cache = {}
-        self.standard_timestamp = ""
+        self.file_position = 0  # 已處理完整行的結尾位元組位置
+        self.line_buffer: list[bytes] = []  # 尚未寫完的行 (分段保存), 等待下次讀取補齊
+        self.line_buffer_size = 0
+        self.process_cache = {}  # 事件快取鍵 -> 最新的 LogEvent
+        self.standard_timestamp = 0
+        # 最近一局的原始 (地圖, 殺手 ID, 物品), 供切換語言時重新翻譯
+        self.game_info: Optional[tuple] = None
+
+        self.generator_state = {}  # (編號, 變數名稱) -> 目前顯示的值, 供重新啟動時還原
 
         self.reset_mark = False
         self.is_running = True
 
+        # 檢查點 (可選): 定期與結束時保存讀取位置與對局狀態, 重新啟動時接續
+        self.checkpoint_path = checkpoint_path
+        self.last_checkpoint: Optional[dict] = None
+
+        # 批次模式下事件先暫存, 於處理週期結束時以單一信號跨執行緒傳遞
+        self.batch_signals = batch_signals
+        self.pending_events: list[tuple[str, tuple]] = []
+
+        # 對局歷史紀錄 (可選), 寫入於背景執行緒進行
+        self.history = history
+
+        # 效能指標 (可選), 以每個區塊 / 週期為單位記錄, 不在逐行迴圈內計時
+        self.metrics = metrics
+
+    def _emit(self, name: str, *args):
+        if self.batch_signals:
+            self.pending_events.append((name, args))
+        else:
+            getattr(self, name).emit(*args)
+
+    def _flush_events(self):
+        """送出本週期暫存的事件"""
+        if self.history:
+            self.history.flush(self._log_name())
+
+        if self.pending_events:
+            events, self.pending_events = self.pending_events, []
+            self.events_batched.emit(events, time.perf_counter())
+
     def stop(self):
         self.is_running = False
 
-    def run(self):
-        """主處理循環"""
-        while self.is_running:
-            try:
-                if not self.log_dir.exists():
-                    QThread.msleep(LOG_UPDATE_INTERVAL)
-                    continue
-
-                log_files = list(self.log_dir.glob("output_log_*.txt"))
-                if not log_files:
-                    QThread.msleep(LOG_UPDATE_INTERVAL)
-                    continue
-
-                latest_file = max(log_files, key=lambda f: f.stat().st_mtime)
-                if latest_file != self.current_log_file:
-                    self.current_log_file = latest_file
-                    self.file_position = 0
-                    self.log_message_generated.emit(f"{transl('開始監控日誌')}: {latest_file.name}")
-
-                if self.current_log_file.exists():
-                    with open(self.current_log_file, "r", encoding="utf-8", errors="ignore") as f:
-                        f.seek(self.file_position)
-                        new_content = f.read()
-                        self.file_position = f.tell()
-
-                    if new_content:
-                        self._process_log_content(new_content)
-                        self._update_state()
-
-            except Exception as e:
-                self.log_message_generated.emit(f"Error in LogProcessor: {e}")
-
-            QThread.msleep(LOG_UPDATE_INTERVAL)
-
-    def _process_log_content(self, content: str):
-        for line in content.splitlines():
-            strip_line = line.strip()
-            if not strip_line:
-                continue
-
-            for pattern, data_type in LOG_PATTERNS:
-                match = pattern.search(strip_line)
-                if not match:
-                    continue
-
-                try:
-                    search_key = match.group(2) if data_type == "generator" else data_type
-                    log_timestamp = match.group(1)
-                    cache_timestamp = self.process_cache.get(search_key, match).group(1)
-
-                    # 目前不一定要判斷時間戳, 基本上最終結果都是一樣的 (避免意外的寫法)
-                    if log_timestamp >= cache_timestamp:
-                        self.process_cache[search_key] = match
-                except (ValueError, IndexError):
-                    continue
+    def close(self):
+        """關閉持有的日誌檔案"""
+        if self.log_handle:
+            self.log_handle.close()
+            self.log_handle = None
+
+    def watch_paths(self) -> list[Path]:
+        """需要檔案變更通知的路徑 (日誌目錄與目前的日誌), 由 LogTailer 統一監控"""
+        paths = [self.log_dir]
+        if self.current_log_file:
+            paths.append(self.current_log_file)
+        return paths
+
+    def poll(self):
+        """檢查是否輪替到新日誌並讀取新內容"""
+        if not self.is_running:
+            return
+
+        try:
+            if self.pinned_file:
+                next_file = self.pinned_file if self.pinned_file.exists() else self.current_log_file
+            else:
+                added = self.log_index.refresh()
+
+                # 目前的日誌已不存在時改用最新的, 否則只在出現新日誌時切換
+                if self.current_log_file is None or self.current_log_file not in self.log_index:
+                    next_file = self.log_index.latest()
+                else:
+                    next_file = added[-1] if added else self.current_log_file
+
+            if next_file and next_file != self.current_log_file:
+                self._switch_log_file(next_file)
+
+            if self.current_log_file:
+                self.read_new_content()
+
+        except Exception as e:
+            self._emit("log_message_generated", f"Error in LogProcessor: {e}")
+
+        self._flush_events()
+
+    def _switch_log_file(self, log_file: Path):
+        """切換日誌前, 先讀完舊日誌的剩餘內容"""
+        attach = self.current_log_file is None
+        if not attach:
+            self.read_new_content(drain=True)
+            self.close()
+            # 舊日誌最後的操作需在切換前寫入, 否則會被接續到新日誌的對局
+            if self.history:
+                self.history.flush(self._log_name())
+
+        self.current_log_file = log_file
+        self.file_position = 0
+        self.line_buffer = []
+        self.line_buffer_size = 0
+        self._emit("log_message_generated", f"{transl('開始監控日誌')}: {log_file.name}")
+
+        # 首次附加時從檢查點接續, 否則從最近一局的開頭解析, 不必掃描整天的日誌
+        if attach:
+            self.log_handle = open(log_file, "rb")
+            if not self._restore_checkpoint(log_file):
+                self.file_position = find_round_start(self.log_handle)
+            self.log_handle.seek(self.file_position)
+
+    def save_checkpoint(self):
+        """保存目前檔案的識別資訊、已處理位置與對局狀態 (內容未變時不寫入)"""
+        if not self.checkpoint_path or not self.log_handle:
+            return
+
+        checkpoint = {
+            "file": self.current_log_file.name,
+            "identity": file_identity(self.log_handle),
+            "position": self.file_position,
+            "standard_timestamp": self.standard_timestamp,
+            "reset_mark": self.reset_mark,
+            "game_info": self.game_info,
+            "generators": [[*key, value] for key, value in sorted(self.generator_state.items())],
+        }
+        if checkpoint != self.last_checkpoint:
+            save_checkpoint(self.checkpoint_path, checkpoint)
+            self.last_checkpoint = checkpoint
+
+    def _restore_checkpoint(self, log_file: Path) -> bool:
+        """檢查點屬於同一個檔案且未被截斷時還原狀態並立即送出顯示, 否則回傳 False"""
+        checkpoint = load_checkpoint(self.checkpoint_path) if self.checkpoint_path else None
+        if not checkpoint or checkpoint.get("file") != log_file.name:
+            return False
+
+        try:
+            position = checkpoint["position"]
+            if os.fstat(self.log_handle.fileno()).st_size < position or not same_file(
+                self.log_handle, checkpoint["identity"]
+            ):
+                return False
+
+            self.file_position = position
+            self.standard_timestamp = checkpoint["standard_timestamp"]
+            self.reset_mark = checkpoint["reset_mark"]
+            game_info = checkpoint["game_info"]
+            generators = checkpoint["generators"]
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        if game_info:
+            self.game_info = tuple(game_info)
+            self._emit_game_info(*self.game_info)
+
+        for index, field, value in generators:
+            self.generator_state[(index, field)] = value
+            self._emit("generator_updated", index, field, value)
+
+        # JSON 讀回的 game_info 為 list, 轉為與 save_checkpoint 相同的形式, 未變更時才不會重寫
+        checkpoint["game_info"] = self.game_info
+        self.last_checkpoint = checkpoint
+        return True
+
+    def read_new_content(self, drain: bool = False):
+        """以固定大小分塊讀取新增內容, 未寫完的行保留到下次 (drain 時一次讀到檔尾)"""
+        if not self.is_running:
+            return
+
+        try:
+            if self.log_handle is None:
+                if not self.current_log_file.exists():
+                    return
+                self.log_handle = open(self.current_log_file, "rb")
+                self.log_handle.seek(self.file_position + self.line_buffer_size)
+
+            # 檔案被截斷或重建時從頭讀取
+            if os.fstat(self.log_handle.fileno()).st_size < self.log_handle.tell():
+                self.file_position = 0
+                self.line_buffer = []
+                self.line_buffer_size = 0
+                self.log_handle.seek(0)
+
+            has_content = False
+            budget = LOG_READ_MAX_PER_TICK
+            read_bytes = 0
+
+            while drain or budget > 0:
+                chunk = self.log_handle.read(
+                    LOG_READ_CHUNK_SIZE if drain else min(LOG_READ_CHUNK_SIZE, budget)
+                )
+                if not chunk:
+                    break
+                budget -= len(chunk)
+                read_bytes += len(chunk)
+
+                # 只在出現換行時才合併緩衝的分段, 長行跨越多次讀取也不會重複複製
+                line_end = chunk.rfind(b"\n") + 1
+                if line_end:
+                    self.line_buffer.append(chunk[:line_end])
+                    self._flush_line_buffer()
+                    has_content = True
+
+                rest = chunk[line_end:]
+                if rest:
+                    self.line_buffer.append(rest)
+                    self.line_buffer_size += len(rest)
+                    # 過長的單行不會是遊戲事件, 直接解析已讀到的部分, 避免緩衝無限成長
+                    if self.line_buffer_size > LOG_LINE_BUFFER_LIMIT:
+                        self._flush_line_buffer()
+                        has_content = True
+
+            # 舊日誌不會再寫入, 最後一行即使沒有換行也視為完整
+            if drain and self.line_buffer:
+                self._flush_line_buffer()
+                has_content = True
+
+            if has_content:
+                self._update_state()
+
+            if self.metrics and read_bytes:
+                self.metrics.add("log_bytes_read", read_bytes)
+                self.metrics.add("log_read_ticks")
+                self.metrics.set("log_tick_bytes", read_bytes)
+
+            # 達到單次讀取上限, 讓出事件循環後繼續讀取剩餘內容
+            if not drain and budget <= 0:
+                QTimer.singleShot(0, self.read_new_content)
+
+        except Exception as e:
+            self.close()
+            self._emit("log_message_generated", f"Error in LogProcessor: {e}")
+
+        # 舊日誌的剩餘內容與切換後的新內容合併在同一批送出
+        if not drain:
+            self._flush_events()
+
+    def _flush_line_buffer(self):
+        """合併緩衝的分段並解析, 已處理位置推進到緩衝結尾"""
+        content = b"".join(self.line_buffer)
+        self.line_buffer = []
+        self.line_buffer_size = 0
+        self.file_position += len(content)
+        self._process_log_content(content)
+
+    def process_content(self, content: bytes):
+        """解析一段完整的日誌內容並立即更新狀態 (供不經由檔案監控的離線重播使用)"""
+        self._process_log_content(content)
+        if self.process_cache:
+            self._update_state()
+            self._flush_events()
+
+    def _process_log_content(self, content: bytes):
+        """快取中保存解析後的事件, 同一鍵只保留最新的一筆 (以位元組比對, 不解碼整段內容)"""
+        cache = self.process_cache
+        metrics = self.metrics
+        started = time.perf_counter() if metrics else 0
+
+        for event in match_log_content(content):
+            if metrics:
+                metrics.add("log_matches", 1, f'kind="{event.kind.name}"')
+
+            key = event.cache_key
+            cached = cache.get(key)
+
+            # 目前不一定要判斷時間戳, 基本上最終結果都是一樣的 (避免意外的寫法)
+            if cached is None or event.timestamp >= cached.timestamp:
+                cache[key] = event
+
+        if metrics:
+            metrics.observe("log_match_seconds", time.perf_counter() - started)
+            lines = content.count(b"\n") + (not content.endswith(b"\n"))  # 最後一行可能沒有換行
+            metrics.add("log_lines_scanned", lines)
+
+    def _log_name(self) -> str:
+        return self.current_log_file.name if self.current_log_file else ""
+
+    def _emit_game_info(self, map_value: str, slasher_id: int, items_value: str):
+        """以目前語言翻譯對局資訊並發射信號"""
+        map_name = GAME_MAPS.get(map_value, map_value)
+
+        slasher_info = SLASHERS.get(
+            slasher_id, {"name": f"{transl('未知')}({slasher_id})", "icon": None}
+        )
+        slasher_name = slasher_info["name"]
+        slasher_icon = slasher_info["icon"]
+
+        items = parse_items(items_value)
+
+        self._emit("game_info_updated", map_name, slasher_name, slasher_icon, slasher_id)
+
+        session_key = " | ".join(
+            [
+                f"{transl('地圖')}: {map_name}",
+                f"{transl('殺手')}: {slasher_name}",
+                f"{transl('物品')}: {items}",
+            ]
+        )
+
+        self._emit("session_info_updated", session_key)
+
+    def retranslate(self):
+        """切換語言後以保存的原始值重新發射對局資訊, 不需重新讀取日誌"""
+        if self.game_info:
+            self._emit_game_info(*self.game_info)
+            self._flush_events()
 
     def _update_state(self):
         """根據快取解析資料並發射信號"""
+        cache = self.process_cache
+        started = time.perf_counter() if self.metrics else 0
 
-        init = self.process_cache.pop("init", None)
+        init = cache.pop(EventKind.INIT, None)
         if init:
             self.reset_mark = False
-            self.standard_timestamp = init.group(1)
-            self.log_message_generated.emit("Generators Init")
+            self.standard_timestamp = init.timestamp
+            self._emit("log_message_generated", "Generators Init")
+            if self.history:
+                self.history.start_round(self._log_name(), init.timestamp)
 
-        map_data = self.process_cache.pop("map", None)
-        slasher_data = self.process_cache.pop("slasher", None)
-        items_data = self.process_cache.pop("items", None)
+        map_data = cache.pop(EventKind.MAP, None)
+        slasher_data = cache.pop(EventKind.SLASHER, None)
+        items_data = cache.pop(EventKind.ITEMS, None)
 
         if map_data and slasher_data and items_data:
-            timestamp = max(map_data.group(1), slasher_data.group(1), items_data.group(1))
+            timestamp = max(map_data.timestamp, slasher_data.timestamp, items_data.timestamp)
 
             if timestamp >= self.standard_timestamp:
-                map_val = map_data.group(2).strip()
-                map_name = GAME_MAPS.get(map_val, map_val)
-
-                slasher_id = int(slasher_data.group(2))
-                slasher_info = SLASHERS.get(
-                    slasher_id, {"name": f"{transl('未知')}({slasher_id})", "icon": None}
-                )
-                slasher_name = slasher_info["name"]
-                slasher_icon = slasher_info["icon"]
-
-                items = parse_items(items_data.group(2).strip())
+                self.game_info = (map_data.value, slasher_data.value, items_data.value)
+                self._emit_game_info(*self.game_info)
+                if self.history:
+                    self.history.update_info(self._log_name(), timestamp, *self.game_info)
 
-                self.game_info_updated.emit(map_name, slasher_name, slasher_icon, slasher_id)
+        # 剩下的 INIT / RESET 以外皆為發電機事件, 鍵為 (編號, 變數名稱)
+        for key in sorted(key for key in cache if type(key) is tuple) if cache else ():
+            gen_data = cache.pop(key)
 
-                session_key = " | ".join(
-                    [
-                        f"{transl('地圖')}: {map_name}",
-                        f"{transl('殺手')}: {slasher_name}",
-                        f"{transl('物品')}: {items}",
-                    ]
+            if not self.reset_mark and gen_data.timestamp > self.standard_timestamp:
+                self._emit("generator_updated", gen_data.index, gen_data.field, gen_data.value)
+                self.generator_state[key] = gen_data.value
+                if self.history:
+                    self.history.add_generator(
+                        gen_data.timestamp, gen_data.index, gen_data.field, gen_data.value
+                    )
+                self._emit(
+                    "log_message_generated",
+                    f"generator{gen_data.index} {gen_data.field}: {gen_data.value}",
                 )
 
-                self.session_info_updated.emit(session_key)
-
-        for gen_id in ["generator1", "generator2"]:
-            gen_data = self.process_cache.pop(gen_id, None)
-
-            if gen_data and not self.reset_mark:
-                timestamp, gen_name, var_type, _, _, new_value = gen_data.groups()
-                if timestamp > self.standard_timestamp:
-                    self.generator_updated.emit(gen_name, var_type, new_value)
-                    self.log_message_generated.emit(f"{gen_name} {var_type}: {new_value}")
-
-        reset_data = self.process_cache.pop("reset", None)
-        if reset_data and reset_data.group(1) > self.standard_timestamp:
+        reset_data = cache.pop(EventKind.RESET, None)
+        if reset_data and reset_data.timestamp > self.standard_timestamp:
             self.reset_mark = True
-            self.generators_reset.emit()
-            self.log_message_generated.emit("Generators Reset")
+            self._emit("generators_reset")
+            self.generator_state.clear()
+            self._emit("log_message_generated", "Generators Reset")
+            if self.history:
+                self.history.reset_round(reset_data.timestamp)
+
+        if self.metrics:
+            self.metrics.observe("update_state_seconds", time.perf_counter() - started)
@@ -0,0 +1,152 @@
+from .LogProcessor import LogProcessor
+from ..bootstrap import (
+    Qt,
+    QTimer,
+    QObject,
+    Optional,
+    QFileSystemWatcher,
+    LOG_UPDATE_INTERVAL,
+    LOG_WATCH_SAFETY_INTERVAL,
+    LOG_CHECKPOINT_INTERVAL,
+)
+
+
+class LogTailer(QObject):
+    """
+    在單一工作執行緒中驅動多個 LogProcessor (同一台電腦多開 VRChat 時每個客戶端一個)
+    所有實例共用一個檔案監控器與一個輪詢計時器, 增加實例不會增加執行緒或輪詢
+    """
+
+    def __init__(
+        self,
+        processors: list[LogProcessor],
+        watch: bool = True,
+        poll_interval: int = LOG_UPDATE_INTERVAL,
+    ):
+        super().__init__()
+        self.processors = processors
+        for processor in processors:
+            processor.setParent(self)  # moveToThread 時一併移到工作執行緒
+
+        # 追蹤方式: 預設使用檔案變更通知; watch=False 時僅以 poll_interval (毫秒) 輪詢
+        self.watch = watch
+        self.poll_interval = poll_interval
+        # 確實收到日誌的變更通知後才放寬保底輪詢; Windows 上被其他行程持續寫入的檔案常收不到通知
+        self.notified = False
+
+        self.is_running = True
+
+        # 以下物件需在工作執行緒中建立, 於 run() 初始化
+        self.watcher: Optional[QFileSystemWatcher] = None
+        self.poll_timer: Optional[QTimer] = None
+        self.checkpoint_timer: Optional[QTimer] = None
+
+    def stop(self):
+        self.is_running = False
+        for processor in self.processors:
+            processor.stop()
+
+    def run(self):
+        """啟動監控, 之後由執行緒的事件循環驅動"""
+        if self.watch:
+            self.watcher = QFileSystemWatcher(self)
+            self.watcher.fileChanged.connect(self._on_file_changed)
+            self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+        # 保底輪詢: 變更通知不可用時以 poll_interval 輪詢, 否則僅低頻補漏
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self._poll)
+
+        if any(processor.checkpoint_path for processor in self.processors):
+            self.checkpoint_timer = QTimer(self)
+            self.checkpoint_timer.timeout.connect(self.save_checkpoints)
+            self.checkpoint_timer.start(LOG_CHECKPOINT_INTERVAL)
+
+        self.thread().finished.connect(self.close, Qt.ConnectionType.DirectConnection)
+        self._poll()
+
+    def save_checkpoints(self):
+        for processor in self.processors:
+            processor.save_checkpoint()
+
+    def close(self):
+        """執行緒結束時 (關閉視窗), 保存檢查點並在工作執行緒內釋放計時器與監控器"""
+        for processor in self.processors:
+            processor.save_checkpoint()
+            processor.close()
+
+        for timer in (self.checkpoint_timer, self.poll_timer):
+            if timer:
+                timer.stop()
+                timer.deleteLater()
+        self.checkpoint_timer = self.poll_timer = None
+
+        if self.watcher:
+            self.watcher.deleteLater()
+            self.watcher = None
+
+    def _on_file_changed(self, path: str):
+        for processor in self.processors:
+            if processor.current_log_file and path == str(processor.current_log_file):
+                self.notified = True
+                processor.read_new_content()
+
+        # 檔案被取代或刪除時會自動從監控中移除, 交由 _poll 重新加入
+        if path not in self.watcher.files():
+            self._poll()
+
+    def _on_directory_changed(self, path: str):
+        for processor in self.processors:
+            if str(processor.log_dir) == path:
+                processor.log_index.invalidate()
+        self._poll()
+
+    def _poll(self):
+        if not self.is_running:
+            self.poll_timer.stop()
+            return
+
+        positions = [
+            (processor.current_log_file, processor.file_position) for processor in self.processors
+        ]
+        for processor in self.processors:
+            processor.poll()
+
+        # 輪詢讀到了通知沒有回報的新內容, 表示通知不可靠, 恢復一般輪詢間隔
+        for processor, (log_file, position) in zip(self.processors, positions):
+            if processor.current_log_file == log_file and processor.file_position > position:
+                self.notified = False
+
+        self._update_watch()
+
+    def _update_watch(self):
+        """同步所有實例的監控路徑, 並依通知是否可用調整輪詢間隔"""
+        if not self.watcher:
+            if not self.poll_timer.isActive():
+                self.poll_timer.start(self.poll_interval)
+            return
+
+        watching = True
+
+        directories, files = set(), set()
+        for processor in self.processors:
+            log_dir, *log_file = processor.watch_paths()
+            if log_dir.exists():
+                directories.add(str(log_dir))
+            else:
+                watching = False
+            files.update(str(path) for path in log_file)
+
+        watched = self.watcher.directories() + self.watcher.files()
+        stale = [path for path in watched if path not in directories and path not in files]
+        if stale:
+            self.watcher.removePaths(stale)
+
+        for path in directories.difference(self.watcher.directories()):
+            watching = self.watcher.addPath(path) and watching
+        for path in files.difference(self.watcher.files()):
+            watching = self.watcher.addPath(path) and watching
+
+        interval = LOG_WATCH_SAFETY_INTERVAL if watching and self.notified else self.poll_interval
+        if self.poll_timer.interval() != interval or not self.poll_timer.isActive():
+            self.poll_timer.start(interval)
@@ -0,0 +1,104 @@
+from ..bootstrap import Any, Optional, threading
+
+# 指標名稱 -> (類型, 說明), 輸出 Prometheus 格式時使用
+METRIC_FAMILIES = {
+    "log_bytes_read": ("counter", "Bytes read from the VRChat log"),
+    "log_read_ticks": ("counter", "Read cycles that returned new content"),
+    "log_tick_bytes": ("gauge", "Bytes read in the most recent read cycle"),
+    "log_lines_scanned": ("counter", "Complete log lines scanned"),
+    "log_matches": ("counter", "Events parsed per pattern"),
+    "log_match_seconds": ("summary", "Time spent splitting lines and running the patterns"),
+    "update_state_seconds": ("summary", "Time spent in LogProcessor._update_state"),
+    "signal_latency_seconds": ("summary", "Delay from batching events to handling them in the GUI"),
+    "osc_packets_sent": ("counter", "OSC packets sent"),
+    "osc_packets_failed": ("counter", "OSC packets that failed to send"),
+    "history_batches_written": ("counter", "Session history transactions committed"),
+    "history_batches_failed": ("counter", "Session history transactions rolled back"),
+}
+METRIC_PREFIX = "slashcosense_"
+
+
+class Metrics:
+    """
+    熱路徑計數器與計時器, 由解析執行緒與 GUI 執行緒寫入
+    其他執行緒 (指標端點) 透過 snapshot() 取得複本; 寫入與複製共用一把鎖
+    寫入以每個區塊 / 週期為單位, 加鎖的成本可忽略
+    """
+
+    def __init__(self):
+        self.values: dict[tuple[str, str], float] = {}  # (名稱, 標籤) -> 計數或目前值
+        self.timers: dict[str, list] = {}  # 名稱 -> [次數, 總秒數, 最大秒數]
+        self.collectors = []  # 讀取時才呼叫, 回傳 {(名稱, 標籤): 值} (例如 OSC 的送出計數)
+        self.lock = threading.Lock()  # 新增鍵時字典大小改變, 複製中的執行緒會出錯
+
+    def add(self, name: str, value: float = 1, label: str = ""):
+        key = (name, label)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def set(self, name: str, value: float, label: str = ""):
+        with self.lock:
+            self.values[(name, label)] = value
+
+    def observe(self, name: str, seconds: float):
+        with self.lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                self.timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    def add_collector(self, collector):
+        self.collectors.append(collector)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            values = dict(self.values)
+            timers = {name: list(timer) for name, timer in self.timers.items()}
+
+        for collector in self.collectors:
+            try:
+                values.update(collector())
+            except Exception:
+                pass
+        return {"values": values, "timers": timers}
+
+    def render_prometheus(self, snapshot: Optional[dict] = None) -> str:
+        """Prometheus 文字格式 (0.0.4), 計時器輸出為 summary 的 _sum / _count 與 _max 量測值"""
+        snapshot = snapshot or self.snapshot()
+        values, timers = snapshot["values"], snapshot["timers"]
+
+        lines = []
+        for name, (kind, help_text) in METRIC_FAMILIES.items():
+            metric = f"{METRIC_PREFIX}{name}"
+
+            if kind == "summary":
+                if name not in timers:
+                    continue
+                count, total, peak = timers[name]
+                lines += [
+                    f"# HELP {metric} {help_text}",
+                    f"# TYPE {metric} summary",
+                    f"{metric}_sum {total:.9f}",
+                    f"{metric}_count {count}",
+                    f"# TYPE {metric}_max gauge",
+                    f"{metric}_max {peak:.9f}",
+                ]
+                continue
+
+            series = sorted((label, value) for (key, label), value in values.items() if key == name)
+            if not series:
+                continue
+
+            if kind == "counter":
+                metric += "_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+            lines += [
+                f"{metric}{{{label}}} {value}" if label else f"{metric} {value}"
+                for label, value in series
+            ]
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,62 @@
+from .Metrics import Metrics
+from ..bootstrap import socket, threading
+
+RESPONSE = "HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {length}\r\n\r\n"
+
+
+class MetricsServer:
+    """
+    Prometheus 文字格式的指標端點, 只綁定本機位址
+    請求量極低 (抓取間隔以秒計), 以單一背景執行緒依序處理, 不需完整的 HTTP 伺服器
+    """
+
+    def __init__(self, metrics: Metrics, port: int, host: str = "127.0.0.1"):
+        self.metrics = metrics
+        self.server = socket.create_server((host, port))  # 埠號被占用時由呼叫端得知錯誤
+        self.server.settimeout(0.5)  # 定期檢查是否已關閉
+        self.port = self.server.getsockname()[1]
+
+        self.served_requests = 0
+        self.is_running = True
+
+        self.thread = threading.Thread(target=self._run, name="MetricsServer", daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.is_running = False
+        self.thread.join(timeout=1)
+        self.server.close()
+
+    def _run(self):
+        while self.is_running:
+            try:
+                connection, _address = self.server.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                break
+
+            with connection:
+                try:
+                    connection.settimeout(2)
+                    self._handle(connection)
+                except Exception:
+                    pass  # 單一請求失敗 (連線中斷或格式錯誤) 不結束端點執行緒
+
+    def _handle(self, connection: socket.socket):
+        request = connection.recv(4096).split(b"\r\n", 1)[0].split()
+        path = request[1].split(b"?", 1)[0] if len(request) > 1 else b""
+
+        if request[:1] == [b"GET"] and path in (b"/", b"/metrics"):
+            try:
+                body = self.metrics.render_prometheus().encode("utf-8")
+                status, content_type = "200 OK", "text/plain; version=0.0.4; charset=utf-8"
+            except Exception as e:
+                status, content_type = "500 Internal Server Error", "text/plain"
+                body = f"Error in Metrics: {e}\n".encode("utf-8")
+        else:
+            status, content_type, body = "404 Not Found", "text/plain", b"not found\n"
+
+        header = RESPONSE.format(status=status, content_type=content_type, length=len(body))
+        connection.sendall(header.encode("ascii") + body)
+        self.served_requests += 1
@@ -0,0 +1,112 @@
+from ..bootstrap import (
+    Any,
+    Callable,
+    Optional,
+    deque,
+    threading,
+    load_pythonosc,
+)
+
+
+def osc_parameters(name: str, args: tuple) -> list[tuple[str, Any]]:
+    """LogProcessor 的事件轉為要送出的 avatar 參數 [(參數名稱, 值)]"""
+    if name == "game_info_updated":
+        return [("SlasherID", args[3])]
+
+    if name == "generator_updated":
+        gen_index, var_type, new_value = args
+        if var_type == "REMAINING":
+            return [(f"GENERATOR{gen_index}_FUEL", 4 - int(new_value))]
+        if var_type == "HAS_BATTERY":
+            return [(f"GENERATOR{gen_index}_BATTERY", 1 if new_value is True else 0)]
+
+    if name == "generators_reset":
+        return [
+            ("GENERATOR1_FUEL", 0),
+            ("GENERATOR1_BATTERY", 0),
+            ("GENERATOR2_FUEL", 0),
+            ("GENERATOR2_BATTERY", 0),
+        ]
+
+    return []
+
+
+class OscSender:
+    """
+    OSC 輸出工作執行緒, 編碼與 socket I/O 都不在 GUI 執行緒進行
+    同一週期 send() 的參數在 flush() 時合併為一個 OSC bundle, 同一位址只保留最新值
+    on_result: 每次實際送出後在工作執行緒呼叫 (位址 -> 值, 錯誤訊息), 成功時錯誤訊息為空字串
+    """
+
+    def __init__(
+        self, host: str, port: int, on_result: Optional[Callable[[dict, str], None]] = None
+    ):
+        udp_client, self.bundle_builder, self.message_builder = load_pythonosc()
+        self.client = udp_client.UDPClient(host, port)
+        self.on_result = on_result
+
+        self.pending: dict[str, Any] = {}  # 本週期尚未送出的參數 (僅呼叫端執行緒使用)
+        # deque 的 append / popleft 為原子操作, 無需加鎖
+        self.queue: deque[dict[str, Any]] = deque()
+        self.wake = threading.Event()
+
+        self.sent_packets = 0
+        self.failed_packets = 0
+        self.is_running = True
+
+        self.thread = threading.Thread(target=self._run, name="OscSender", daemon=True)
+        self.thread.start()
+
+    def send(self, param: str, value: Any):
+        self.pending[f"/avatar/parameters/{param}"] = value
+
+    def flush(self):
+        """結束本週期, 交給工作執行緒送出"""
+        if self.pending:
+            batch, self.pending = self.pending, {}
+            self.queue.append(batch)
+            self.wake.set()
+
+    def close(self):
+        self.flush()
+        self.is_running = False
+        self.wake.set()
+        self.thread.join(timeout=1)
+
+    def _run(self):
+        while self.is_running or self.queue:
+            self.wake.wait()
+            self.wake.clear()
+
+            # 尚未送出的多個週期也一併合併, 同一位址以最後的值為準
+            merged = {}
+            while self.queue:
+                merged.update(self.queue.popleft())
+
+            if merged:
+                self._send(merged)
+
+    def _send(self, params: dict[str, Any]):
+        try:
+            if len(params) == 1:
+                [(address, value)] = params.items()
+                self.client.send(self._build_message(address, value))
+            else:
+                bundle = self.bundle_builder.OscBundleBuilder(self.bundle_builder.IMMEDIATELY)
+                for address, value in params.items():
+                    bundle.add_content(self._build_message(address, value))
+                self.client.send(bundle.build())
+
+            self.sent_packets += 1
+            error = ""
+        except Exception as e:
+            self.failed_packets += 1
+            error = str(e) or type(e).__name__
+
+        if self.on_result:
+            self.on_result(params, error)
+
+    def _build_message(self, address: str, value: Any):
+        builder = self.message_builder.OscMessageBuilder(address=address)
+        builder.add_arg(value)
+        return builder.build()
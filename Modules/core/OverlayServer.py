@@ -0,0 +1,194 @@
+from ..bootstrap import (
+    Any,
+    json,
+    threading,
+    QByteArray,
+    QCryptographicHash,
+    load_asyncio,
+    OVERLAY_MAX_BUFFER,
+)
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# 最小的疊加層頁面 (OBS 瀏覽器來源可直接使用), 連線後套用快照與之後的差異
+OVERLAY_PAGE = b"""<!doctype html>
+<meta charset="utf-8">
+<title>SlashcoSense</title>
+<style>body{margin:0;font:20px sans-serif;color:#fff;text-shadow:0 0 4px #000}</style>
+<pre id="state"></pre>
+<script>
+const state = {}, view = document.getElementById("state");
+(function connect() {
+  const ws = new WebSocket(`ws://${location.host}/ws`);
+  ws.onmessage = (e) => {
+    Object.assign(state, JSON.parse(e.data).state);
+    view.textContent = Object.entries(state).map(([k, v]) => `${k}: ${v ?? "-"}`).join("\\n");
+  };
+  ws.onclose = () => setTimeout(connect, 1000);
+})();
+</script>
+"""
+
+
+def websocket_accept(key: bytes) -> bytes:
+    """握手回應的 Sec-WebSocket-Accept (以 Qt 計算 SHA-1, 打包時不需 hashlib)"""
+    algorithm = QCryptographicHash.Algorithm.Sha1
+    return bytes(QCryptographicHash.hash(QByteArray(key + WEBSOCKET_GUID), algorithm).toBase64())
+
+
+def encode_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """伺服器送出的 WebSocket 資料框 (不遮罩, 單一框)"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, length))
+    elif length < 1 << 16:
+        header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+    return header + payload
+
+
+def http_response(status: str, content_type: str, body: bytes) -> bytes:
+    header = (
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+        "Cache-Control: no-store\r\nConnection: close\r\n\r\n"
+    )
+    return header.encode("ascii") + body
+
+
+class OverlayServer:
+    """
+    本機 WebSocket / HTTP 事件推送, asyncio 事件循環在獨立執行緒, 不影響日誌解析
+    狀態差異只編碼一次, 同一份資料框寫給所有訂閱者; 新連線先收到完整快照
+    GET / 疊加層頁面, GET /state 目前狀態 (JSON), GET /ws 建立 WebSocket
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        self.asyncio = load_asyncio()
+        self.state: dict[str, Any] = {}  # 以下僅事件循環執行緒使用
+        self.clients = set()
+
+        # 在啟動執行緒前綁定埠號, 被占用時由呼叫端直接得知錯誤
+        self.loop = self.asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(
+            self.asyncio.start_server(self._handle, host, port)
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        self.published_diffs = 0
+        self.dropped_clients = 0
+
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="OverlayServer", daemon=True
+        )
+        self.thread.start()
+
+    def publish(self, changes: dict[str, Any]):
+        """(任何執行緒) 合併狀態差異並推送給所有訂閱者"""
+        if changes:
+            self.loop.call_soon_threadsafe(self._publish, changes)
+
+    def close(self):
+        if self.loop.is_running():
+            self.asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout=2)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=2)
+        self.loop.close()
+
+    async def _shutdown(self):
+        self.server.close()
+        for writer in list(self.clients):
+            self._drop(writer, encode_frame(b"\x03\xe9", opcode=0x8))  # 1001: 伺服器關閉
+        await self.server.wait_closed()
+
+    def _publish(self, changes: dict[str, Any]):
+        self.state.update(changes)
+        self.published_diffs += 1
+
+        if self.clients:
+            frame = encode_frame(json.dumps({"type": "diff", "state": changes}).encode("utf-8"))
+            for writer in list(self.clients):
+                self._send(writer, frame)
+
+    def _send(self, writer, frame: bytes):
+        # 讀取速度跟不上的訂閱者直接中斷, 不為單一連線累積記憶體
+        if writer.transport.get_write_buffer_size() > OVERLAY_MAX_BUFFER:
+            self.dropped_clients += 1
+            self._drop(writer)
+        else:
+            writer.write(frame)
+
+    def _drop(self, writer, frame: bytes = b""):
+        self.clients.discard(writer)
+        if frame:
+            writer.write(frame)
+        writer.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await self.asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+            request_line, *header_lines = request.decode("latin-1").split("\r\n")
+            method, path, *_ = request_line.split(" ") + [""]
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            path = path.split("?", 1)[0]
+            if method != "GET":
+                writer.write(http_response("405 Method Not Allowed", "text/plain", b""))
+            elif headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_websocket(reader, writer, headers)
+                return
+            elif path == "/state":
+                body = json.dumps(self.state).encode("utf-8")
+                writer.write(http_response("200 OK", "application/json", body))
+            elif path == "/":
+                writer.write(http_response("200 OK", "text/html; charset=utf-8", OVERLAY_PAGE))
+            else:
+                writer.write(http_response("404 Not Found", "text/plain", b"not found\n"))
+
+            await writer.drain()
+        except (OSError, ValueError, self.asyncio.IncompleteReadError, self.asyncio.TimeoutError):
+            pass
+        finally:
+            if writer not in self.clients:
+                writer.close()
+
+    async def _serve_websocket(self, reader, writer, headers: dict[str, str]):
+        key = headers.get("sec-websocket-key", "").encode("ascii")
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + websocket_accept(key) + b"\r\n\r\n"
+        )
+        snapshot = json.dumps({"type": "snapshot", "state": self.state}).encode("utf-8")
+        writer.write(encode_frame(snapshot))
+        self.clients.add(writer)
+
+        try:
+            # 訂閱者只需維持連線, 讀取控制框 (ping / close), 其餘資料忽略
+            while writer in self.clients:
+                opcode, payload = await self._read_frame(reader)
+                if opcode == 0x8:
+                    self._drop(writer, encode_frame(payload[:2], opcode=0x8))
+                elif opcode == 0x9:
+                    writer.write(encode_frame(payload, opcode=0xA))
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    async def _read_frame(self, reader) -> tuple[int, bytes]:
+        head = await reader.readexactly(2)
+        opcode, length = head[0] & 0x0F, head[1] & 0x7F
+        if length == 126:
+            length = int.from_bytes(await reader.readexactly(2), "big")
+        elif length == 127:
+            length = int.from_bytes(await reader.readexactly(8), "big")
+        if length > 1 << 16:
+            raise ValueError("frame too large")
+
+        mask = await reader.readexactly(4) if head[1] & 0x80 else b""
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return opcode, payload
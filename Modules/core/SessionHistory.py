@@ -0,0 +1,220 @@
+from ..bootstrap import (
+    Any,
+    Path,
+    deque,
+    sqlite3,
+    threading,
+    Optional,
+    HISTORY_DB_PATH,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    log_file TEXT NOT NULL,
+    started_at INTEGER NOT NULL,  -- 日誌時間戳 YYYYMMDDhhmmss
+    map TEXT,
+    slasher_id INTEGER,
+    items TEXT,
+    reset_at INTEGER,
+    UNIQUE (log_file, started_at)
+);
+CREATE TABLE IF NOT EXISTS generator_events (
+    round_id INTEGER NOT NULL REFERENCES rounds (id),
+    timestamp INTEGER NOT NULL,
+    generator INTEGER NOT NULL,
+    field TEXT NOT NULL,
+    value,
+    UNIQUE (round_id, timestamp, generator, field, value)
+);
+CREATE TABLE IF NOT EXISTS log_files (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,  -- 已處理完整行的結尾位元組位置
+    started_at INTEGER NOT NULL,  -- 續讀時沿用的對局狀態
+    reset_mark INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_started_at ON rounds (started_at);
+CREATE INDEX IF NOT EXISTS rounds_map ON rounds (map, started_at);
+CREATE INDEX IF NOT EXISTS rounds_slasher ON rounds (slasher_id, started_at);
+"""
+
+
+class SessionHistory:
+    """
+    對局歷史紀錄 (SQLite), 寫入由背景執行緒以交易批次完成, 解析執行緒不等待磁碟
+    重新啟動時會重新解析最近一局, 以 (日誌檔, 開始時間) 唯一鍵避免重複紀錄
+    """
+
+    def __init__(self, db_path: Path = HISTORY_DB_PATH):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 連線只在工作執行緒使用, 建立與初始化在這裡完成以便呼叫端直接得知錯誤
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")  # 查詢時不阻塞寫入
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+        self.pending: list[tuple] = []  # 本週期的寫入操作 (僅呼叫端執行緒使用)
+        self.queue: deque[list[tuple]] = deque()
+        self.wake = threading.Event()
+        self.round_id: Optional[int] = None  # 目前對局 (僅工作執行緒使用)
+
+        self.written_batches = 0
+        self.failed_batches = 0
+        self.is_running = True
+
+        self.thread = threading.Thread(target=self._run, name="SessionHistory", daemon=True)
+        self.thread.start()
+
+    def start_round(self, log_file: str, timestamp: int):
+        self.pending.append(("start", log_file, timestamp))
+
+    def update_info(
+        self, log_file: str, timestamp: int, map_value: str, slasher_id: int, items: str
+    ):
+        self.pending.append(("info", log_file, timestamp, map_value, slasher_id, items))
+
+    def add_generator(self, timestamp: int, generator: int, field: str, value: Any):
+        self.pending.append(("generator", timestamp, generator, field, value))
+
+    def reset_round(self, timestamp: int):
+        self.pending.append(("reset", timestamp))
+
+    def extend(self, operations: list[tuple]):
+        """加入已組好的寫入操作 (例如歷史索引器的結果)"""
+        self.pending.extend(operations)
+
+    def flush(self, log_file: Optional[str] = None):
+        """
+        結束本週期, 交給工作執行緒以單一交易寫入
+        指定日誌檔時先接續該檔案的最後一局, 多個實例交錯寫入時各自的事件不會記到別的對局
+        """
+        if self.pending:
+            batch, self.pending = self.pending, []
+            if log_file:
+                batch.insert(0, ("resume", log_file))
+            self.queue.append(batch)
+            self.wake.set()
+
+    def close(self):
+        self.flush()
+        self.is_running = False
+        self.wake.set()
+        self.thread.join(timeout=5)
+        self.connection.close()
+
+    def _run(self):
+        while self.is_running or self.queue:
+            self.wake.wait()
+            self.wake.clear()
+
+            operations = []
+            while self.queue:
+                operations.extend(self.queue.popleft())
+
+            if operations:
+                self._write(operations)
+
+    def _write(self, operations: list[tuple]):
+        """同一批操作在單一交易中依序套用"""
+        try:
+            with self.connection:
+                for operation in operations:
+                    getattr(self, f"_{operation[0]}")(*operation[1:])
+            self.written_batches += 1
+        except sqlite3.Error:
+            self.round_id = None
+            self.failed_batches += 1
+
+    def _start(self, log_file: str, timestamp: int):
+        execute = self.connection.execute
+        execute(
+            "INSERT OR IGNORE INTO rounds (log_file, started_at) VALUES (?, ?)",
+            (log_file, timestamp),
+        )
+        self.round_id = execute(
+            "SELECT id FROM rounds WHERE log_file = ? AND started_at = ?", (log_file, timestamp)
+        ).fetchone()[0]
+
+    def _resume(self, log_file: Optional[str]):
+        """接續同一日誌檔的最後一局 (索引器從檢查點續讀時使用), None 表示從新檔案開始"""
+        if log_file is None:
+            self.round_id = None
+            return
+
+        row = self.connection.execute(
+            "SELECT id FROM rounds WHERE log_file = ? ORDER BY started_at DESC LIMIT 1", (log_file,)
+        ).fetchone()
+        self.round_id = row[0] if row else None
+
+    def _info(self, log_file: str, timestamp: int, map_value: str, slasher_id: int, items: str):
+        # 沒有初始化行的對局 (例如只找到對局資訊) 以對局資訊的時間作為開始
+        if self.round_id is None:
+            self._start(log_file, timestamp)
+
+        self.connection.execute(
+            "UPDATE rounds SET map = ?, slasher_id = ?, items = ? WHERE id = ?",
+            (map_value, slasher_id, items, self.round_id),
+        )
+
+    def _generator(self, timestamp: int, generator: int, field: str, value: Any):
+        if self.round_id is not None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO generator_events VALUES (?, ?, ?, ?, ?)",
+                (self.round_id, timestamp, generator, field, value),
+            )
+
+    def _reset(self, timestamp: int):
+        if self.round_id is not None:
+            self.connection.execute(
+                "UPDATE rounds SET reset_at = ? WHERE id = ?", (timestamp, self.round_id)
+            )
+
+    def _checkpoint(self, *checkpoint):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO log_files VALUES (?, ?, ?, ?, ?, ?)", checkpoint
+        )
+
+    def _read_only(self) -> sqlite3.Connection:
+        """獨立的唯讀連線 (as_uri 會處理 Windows 路徑與 ?#% 等字元的編碼)"""
+        return sqlite3.connect(self.db_path.resolve().as_uri() + "?mode=ro", uri=True)
+
+    def checkpoints(self) -> dict[str, tuple]:
+        """日誌檔名 -> (大小, mtime_ns, 位移, 對局開始時間, 重置標記)"""
+        connection = self._read_only()
+        try:
+            rows = connection.execute("SELECT * FROM log_files").fetchall()
+        finally:
+            connection.close()
+        return {name: tuple(rest) for name, *rest in rows}
+
+    def rounds(
+        self,
+        map_value: Optional[str] = None,
+        slasher_id: Optional[int] = None,
+        since: Optional[int] = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """查詢歷史對局 (新到舊), 使用獨立的唯讀連線, 可在任何執行緒呼叫"""
+        conditions, params = [], []
+        for column, value in (("map", map_value), ("slasher_id", slasher_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("started_at >= ?")
+            params.append(since)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        connection = self._read_only()
+        try:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(
+                f"SELECT * FROM rounds {where} ORDER BY started_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        finally:
+            connection.close()
+        return [dict(row) for row in rows]
@@ -1 +1,23 @@
 from .LogProcessor import LogProcessor
+from .LogTailer import LogTailer
+from .OscSender import OscSender, osc_parameters
+from .ImageCache import ImageCache
+from .SessionHistory import SessionHistory
+from .Metrics import Metrics
+from ..bootstrap import sys, import_module
+
+# 只在視窗或特定模式使用的元件, 第一次取用時才匯入 (無介面模式不載入 QtGui 與指標端點)
+LAZY_MODULES = ("IconRenderer", "MetricsServer", "OverlayServer", "HeadlessDaemon")  # 與類別同名
+
+
+def __getattr__(name: str):
+    if name not in LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import_module(f"{__name__}.{name}")
+    # 匯入子模組後套件屬性會指向模組本身 (連帶匯入的子模組亦同), 改回同名的類別
+    for lazy in LAZY_MODULES:
+        module = sys.modules.get(f"{__name__}.{lazy}")
+        if module is not None:
+            globals()[lazy] = getattr(module, lazy)
+    return globals()[name]
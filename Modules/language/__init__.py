@@ -9,6 +9,7 @@ SysPlat = platform.system()
 
 Default = "en_US"
 Words = {"en_US": en_US, "zh_TW": zh_TW, "zh_CN": zh_CN, "ja_JP": ja_JP}
+Names = {"en_US": "English", "zh_TW": "繁體中文", "zh_CN": "简体中文", "ja_JP": "日本語"}
 Locale = {
     "950": "zh_TW",
     "936": "zh_CN",
@@ -16,6 +17,10 @@ Locale = {
     "1252": "en_US",
 }
 
+Tables = {}  # 語言 -> 已建立的查詢表
+Listeners = []  # 切換語言後的回呼
+Current = {}  # 目前語言的查詢表
+
 
 def detect_system_language(lang) -> str:
     """檢測系統語言"""
@@ -36,23 +41,65 @@ def detect_system_language(lang) -> str:
     return lang
 
 
-def translator(lang=None):
-    """獲取翻譯器"""
-
-    Transl = {}
-    SetLang = ""
+def resolve_language(lang=None) -> str:
+    """將語言代碼 / Windows 代碼頁轉為支援的語言, 未指定時自動檢測"""
 
     lang = detect_system_language(lang) if lang is None else lang
 
     if isinstance(lang, str) and lang in Words:
-        Transl, SetLang = Words.get(lang), lang
+        return lang
     elif lang in Locale:
-        Transl, SetLang = Words.get(Locale.get(lang)), Locale.get(lang)
-    else:
-        Transl, SetLang = Words.get(Default), Default
+        return Locale.get(lang)
+    return Default
+
+
+def lookup_table(lang: str) -> dict:
+    """取得該語言的查詢表, 第一次使用時才建立並快取 (省略原文與譯文相同的項目)"""
+
+    table = Tables.get(lang)
+    if table is None:
+        table = Tables[lang] = {text: word for text, word in Words[lang].items() if text != word}
+    return table
+
+
+def translator(lang=None):
+    """獲取翻譯器"""
+
+    SetLang = resolve_language(lang)
+    Transl = lookup_table(SetLang)
 
     return (lambda text: Transl.get(text, text), SetLang)
 
 
+def transl(text: str) -> str:
+    """以目前語言翻譯, 切換語言後所有引用此函式的模組立即生效"""
+    return Current.get(text, text)
+
+
+def current_language() -> str:
+    """目前的語言代碼, 每次呼叫時讀取 (直接匯入 setLang 只會取得匯入當下的值)"""
+    return setLang
+
+
+def on_language_changed(callback):
+    """註冊切換語言後的回呼 (參數為新的語言代碼), 註冊時先以目前語言呼叫一次"""
+    Listeners.append(callback)
+    callback(setLang)
+    return callback
+
+
+def set_language(lang=None) -> str:
+    """執行中切換語言, 只替換查詢表, 不重新載入任何模組"""
+    global Current, setLang
+
+    setLang = resolve_language(lang)
+    Current = lookup_table(setLang)
+
+    for callback in Listeners:
+        callback(setLang)
+
+    return setLang
+
+
 # 先使用自動檢測
-transl, setLang = translator()
+setLang = set_language()
@@ -53,12 +53,15 @@ en_US = {
     "OSC 設定": "OSC Settings",
     "啟用 OSC": "Enable OSC",
     "錯誤：OSC 啟用失敗": "Error: Failed to Enable OSC",
+    "錯誤：OSC 傳送失敗": "Error: Failed to Send OSC",
     "OSC 已啟用": "OSC Enabled",
     "OSC 已停用": "OSC Disabled",
     "顯示 OSC 日誌": "Show OSC Logs",
     "埠": "Port",
     "埠號:": "Port:",
+    "語言:": "Language:",
     "日誌監控": "Log Monitor",
+    "效能指標": "Performance Metrics",
     "開始監控日誌": "Start Log Monitoring",
     "載入失敗": "Failed to Load",
     "錯誤：埠號無效或 OSC 不可用": "Error: Invalid Port or OSC Unavailable",
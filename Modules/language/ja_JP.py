@@ -53,12 +53,15 @@ ja_JP = {
     "OSC 設定": "OSC設定",
     "啟用 OSC": "OSCを有効化",
     "錯誤：OSC 啟用失敗": "エラー：OSCの有効化に失敗しました",
+    "錯誤：OSC 傳送失敗": "エラー：OSCの送信に失敗しました",
     "OSC 已啟用": "OSCが有効になりました",
     "OSC 已停用": "OSCが無効になりました",
     "顯示 OSC 日誌": "OSCログを表示",
     "埠": "ポート",
     "埠號:": "ポート番号：",
+    "語言:": "言語：",
     "日誌監控": "ログ監視",
+    "效能指標": "パフォーマンス指標",
     "開始監控日誌": "ログ監視を開始",
     "載入失敗": "読み込み失敗",
     "錯誤：埠號無效或 OSC 不可用": "エラー：ポート番号が無効またはOSCが使用不可",
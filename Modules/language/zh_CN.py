@@ -53,12 +53,15 @@ zh_CN = {
     "OSC 設定": "OSC 设置",
     "啟用 OSC": "启用 OSC",
     "錯誤：OSC 啟用失敗": "错误：OSC 启用失败",
+    "錯誤：OSC 傳送失敗": "错误：OSC 传送失败",
     "OSC 已啟用": "OSC 已启用",
     "OSC 已停用": "OSC 已停用",
     "顯示 OSC 日誌": "显示 OSC 日志",
     "埠": "端口",
     "埠號:": "端口号：",
+    "語言:": "语言：",
     "日誌監控": "日志监控",
+    "效能指標": "性能指标",
     "開始監控日誌": "开始监控日志",
     "載入失敗": "加载失败",
     "錯誤：埠號無效或 OSC 不可用": "错误：端口号无效或 OSC 不可用",
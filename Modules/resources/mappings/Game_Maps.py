@@ -1,14 +1,22 @@
-from ...language import transl
-
-GAME_MAPS = {
-    "0": transl("舊 SlashCo 總部"),
-    "SlashCoHQ": transl("舊 SlashCo 總部"),
-    "1": transl("馬龍斯農場"),
-    "MalonesFarmyard": transl("馬龍斯農場"),
-    "2": transl("菲利普斯•書斯特伍德高中"),
-    "PhilipsWestwoodHighSchool": transl("菲利普斯•書斯特伍德高中"),
-    "3": transl("伊斯特伍德綜合醫院"),
-    "EastwoodGeneralHospital": transl("伊斯特伍德綜合醫院"),
-    "4": transl("德爾塔科研機構"),
-    "ResearchFacilityDelta": transl("德爾塔科研機構"),
-}
+from ...utils import LazyMapping
+from ...language import transl, on_language_changed
+
+
+def _build_game_maps() -> dict:
+    """地圖 ID / 名稱 -> 翻譯名稱"""
+    return {
+        "0": transl("舊 SlashCo 總部"),
+        "SlashCoHQ": transl("舊 SlashCo 總部"),
+        "1": transl("馬龍斯農場"),
+        "MalonesFarmyard": transl("馬龍斯農場"),
+        "2": transl("菲利普斯•書斯特伍德高中"),
+        "PhilipsWestwoodHighSchool": transl("菲利普斯•書斯特伍德高中"),
+        "3": transl("伊斯特伍德綜合醫院"),
+        "EastwoodGeneralHospital": transl("伊斯特伍德綜合醫院"),
+        "4": transl("德爾塔科研機構"),
+        "ResearchFacilityDelta": transl("德爾塔科研機構"),
+    }
+
+
+GAME_MAPS = LazyMapping(_build_game_maps)
+on_language_changed(GAME_MAPS.reset)
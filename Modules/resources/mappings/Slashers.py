@@ -1,61 +1,69 @@
-from ...language import transl
+from ...language import transl, on_language_changed
+from ...utils import LazyMapping
 from ...bootstrap import ASSETS
 
-SLASHERS = {
-    0: {
-        "name": transl("巴巴布伊 【肌肉男 / 隱形怪】"),
-        "icon": f"{ASSETS}/BABABOOEY.webp",
-    },
-    1: {
-        "name": transl("席德 【手槍怪 / 餅乾怪】"),
-        "icon": f"{ASSETS}/SID.webp",
-    },
-    2: {
-        "name": transl("特羅勒格巨魔【笑臉男 / 火柴人】"),
-        "icon": f"{ASSETS}/TROLLGE.webp",
-    },
-    3: {
-        "name": transl("博格梅爾【機器人】"),
-        "icon": f"{ASSETS}/BORGMIRE.webp",
-    },
-    4: {
-        "name": transl("阿博米納特【憎惡者 / 外星人】"),
-        "icon": f"{ASSETS}/ABOMIGNAT.webp",
-    },
-    5: {
-        "name": transl("口渴 【爬行者 / 牛奶怪】"),
-        "icon": f"{ASSETS}/THIRSTY.webp",
-    },
-    6: {
-        "name": transl("埃爾默神父 【霰彈槍 / 神父】"),
-        "icon": f"{ASSETS}/FATHER_ELMER.webp",
-    },
-    7: {
-        "name": transl("觀察者 【高個子】"),
-        "icon": f"{ASSETS}/THE_WATCHER.webp",
-    },
-    8: {
-        "name": transl("野獸 【貓貓 / 貓老太】"),
-        "icon": f"{ASSETS}/THE_BEAST.webp",
-    },
-    9: {
-        "name": transl("海豚人"),
-        "icon": f"{ASSETS}/DOLPHINMAN.webp",
-    },
-    10: {
-        "name": transl("伊戈爾【DJ / 創造者 / 毀滅者】"),
-        "icon": f"{ASSETS}/IGOR.webp",
-    },
-    11: {
-        "name": transl("牢騷者【乞丐】"),
-        "icon": f"{ASSETS}/THE_GROUCH.webp",
-    },
-    12: {
-        "name": transl("公主【狗】"),
-        "icon": f"{ASSETS}/PRINCESS.webp",
-    },
-    13: {
-        "name": transl("極速奔跑者"),
-        "icon": f"{ASSETS}/SPEEDRUNNER.webp",
-    },
-}
+
+def _build_slashers() -> dict:
+    """殺手 ID -> 名稱與圖片"""
+    return {
+        0: {
+            "name": transl("巴巴布伊 【肌肉男 / 隱形怪】"),
+            "icon": f"{ASSETS}/BABABOOEY.webp",
+        },
+        1: {
+            "name": transl("席德 【手槍怪 / 餅乾怪】"),
+            "icon": f"{ASSETS}/SID.webp",
+        },
+        2: {
+            "name": transl("特羅勒格巨魔【笑臉男 / 火柴人】"),
+            "icon": f"{ASSETS}/TROLLGE.webp",
+        },
+        3: {
+            "name": transl("博格梅爾【機器人】"),
+            "icon": f"{ASSETS}/BORGMIRE.webp",
+        },
+        4: {
+            "name": transl("阿博米納特【憎惡者 / 外星人】"),
+            "icon": f"{ASSETS}/ABOMIGNAT.webp",
+        },
+        5: {
+            "name": transl("口渴 【爬行者 / 牛奶怪】"),
+            "icon": f"{ASSETS}/THIRSTY.webp",
+        },
+        6: {
+            "name": transl("埃爾默神父 【霰彈槍 / 神父】"),
+            "icon": f"{ASSETS}/FATHER_ELMER.webp",
+        },
+        7: {
+            "name": transl("觀察者 【高個子】"),
+            "icon": f"{ASSETS}/THE_WATCHER.webp",
+        },
+        8: {
+            "name": transl("野獸 【貓貓 / 貓老太】"),
+            "icon": f"{ASSETS}/THE_BEAST.webp",
+        },
+        9: {
+            "name": transl("海豚人"),
+            "icon": f"{ASSETS}/DOLPHINMAN.webp",
+        },
+        10: {
+            "name": transl("伊戈爾【DJ / 創造者 / 毀滅者】"),
+            "icon": f"{ASSETS}/IGOR.webp",
+        },
+        11: {
+            "name": transl("牢騷者【乞丐】"),
+            "icon": f"{ASSETS}/THE_GROUCH.webp",
+        },
+        12: {
+            "name": transl("公主【狗】"),
+            "icon": f"{ASSETS}/PRINCESS.webp",
+        },
+        13: {
+            "name": transl("極速奔跑者"),
+            "icon": f"{ASSETS}/SPEEDRUNNER.webp",
+        },
+    }
+
+
+SLASHERS = LazyMapping(_build_slashers)
+on_language_changed(SLASHERS.reset)  # 各語言的表分別快取, 切換時只替換參照
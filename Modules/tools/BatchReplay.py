@@ -0,0 +1,111 @@
+"""
+離線批次重播: 不啟動 Qt 介面, 以記憶體映射讀取日誌並輸出解析出的事件 (JSONL)
+
+python -m Modules.tools.BatchReplay output_log_*.txt -o events.jsonl
+"""
+
+from ..core import LogProcessor
+from ..bootstrap import os, sys, json, mmap, time, argparse, Path, LOG_READ_CHUNK_SIZE
+
+
+class EventRecorder:
+    """連接 LogProcessor 的信號, 將事件逐行寫為 JSON"""
+
+    def __init__(self, processor: LogProcessor, output):
+        self.output = output
+        self.source = ""
+        self.line_number = 0
+        self.events = 0
+
+        processor.game_info_updated.connect(self._on_game_info)
+        processor.session_info_updated.connect(self._on_session_info)
+        processor.generator_updated.connect(self._on_generator)
+        processor.generators_reset.connect(self._on_reset)
+
+    def _write(self, event: dict):
+        event["file"] = self.source
+        event["line"] = self.line_number
+        self.output.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self.events += 1
+
+    def _on_game_info(self, map_name: str, slasher_name: str, _slasher_icon: str, slasher_id: int):
+        self._write(
+            {"type": "game", "map": map_name, "slasher": slasher_name, "slasher_id": slasher_id}
+        )
+
+    def _on_session_info(self, session_key: str):
+        self._write({"type": "session", "session": session_key})
+
+    def _on_generator(self, gen_index: int, var_type: str, new_value):
+        self._write(
+            {"type": "generator", "generator": gen_index, "var": var_type, "value": new_value}
+        )
+
+    def _on_reset(self):
+        self._write({"type": "reset"})
+
+
+def replay_file(processor: LogProcessor, recorder: EventRecorder, path: Path) -> tuple[int, int]:
+    """
+    以記憶體映射逐塊讀取整個日誌, 回傳 (行數, 位元組數)
+    與即時監控相同, 每個對齊到換行的區塊解析後只更新一次狀態 (事件的 line 為該區塊的最後一行)
+    """
+    recorder.source = path.name
+    recorder.line_number = 0
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0, 0
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            start = 0
+            while start < size:
+                # 區塊結尾對齊到換行, 避免行被切斷 (最後一行即使沒有換行也視為完整)
+                end = mm.find(b"\n", min(start + LOG_READ_CHUNK_SIZE, size) - 1)
+                end = size if end < 0 else end + 1
+
+                chunk = view[start:end].tobytes()  # 比對需要 bytes, 每個區塊只複製一次
+                recorder.line_number += chunk.count(b"\n") + (not chunk.endswith(b"\n"))
+                processor._process_log_content(chunk)
+                processor._update_state()
+
+                start = end
+
+    return recorder.line_number, size
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense headless log replay")
+    parser.add_argument("logs", nargs="+", type=Path, help="output_log_*.txt files")
+    parser.add_argument("-o", "--output", type=Path, help="JSONL output path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        total_lines = total_bytes = 0
+        started = time.perf_counter()
+
+        for path in args.logs:
+            processor = LogProcessor(path.parent)  # 每個檔案各自的對局狀態
+            recorder = EventRecorder(processor, output)
+            lines, size = replay_file(processor, recorder, path)
+            total_lines += lines
+            total_bytes += size
+
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        print(
+            f"{len(args.logs)} files, {total_lines} lines,"
+            f" {total_bytes / 1e6:.1f} MB in {elapsed:.3f}s"
+            f" | {total_lines / elapsed:,.0f} lines/s, {total_bytes / 1e6 / elapsed:,.1f} MB/s",
+            file=sys.stderr,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+解析效能基準測試: 以合成日誌測量吞吐量、峰值記憶體與各階段耗時
+
+python -m Modules.tools.Benchmark --size 50 --repeat 3
+"""
+
+import tempfile  # 僅開發工具使用, 不放進 bootstrap (打包時已排除)
+import tracemalloc
+
+from ..core import LogProcessor
+from ..utils import match_log_line
+from ..resources import parse_items
+from ..resources.mappings.Items import ITEMS
+from ..bootstrap import sys, json, time, argparse, Path, QCoreApplication
+from .LogGenerator import LogGenerator
+
+
+class StageTimer:
+    """累計各階段耗時"""
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+
+    def wrap(self, name: str, func):
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.totals[name] = self.totals.get(name, 0.0) + time.perf_counter() - started
+
+        return timed
+
+
+def run_pipeline(path: Path, timer: StageTimer = None) -> LogProcessor:
+    """
+    走即時監控的讀取路徑: read_new_content 分塊讀取 -> 行緩衝 -> 解析 (位元組),
+    每個週期 (最多 LOG_READ_MAX_PER_TICK) 更新一次狀態, 直到讀不到新內容
+    """
+    processor = LogProcessor(path, batch_signals=True)
+    if timer:
+        processor._process_log_content = timer.wrap("parse", processor._process_log_content)
+        processor._update_state = timer.wrap("state", processor._update_state)
+
+    processor.current_log_file = path  # 從檔頭讀起 (poll 會從最近一局的開頭接續)
+    consumed = -1
+    while consumed != processor.file_position + processor.line_buffer_size:
+        consumed = processor.file_position + processor.line_buffer_size
+        processor.read_new_content()
+
+    processor.close()
+    return processor
+
+
+def bench_pipeline(path: Path, lines: int, repeat: int) -> dict:
+    size = path.stat().st_size
+    best = None
+    for _ in range(repeat):
+        timer = StageTimer()
+        started = time.perf_counter()
+        run_pipeline(path, timer)
+        elapsed = time.perf_counter() - started
+
+        if best is None or elapsed < best["seconds"]:
+            best = {
+                "seconds": elapsed,
+                "lines_per_second": lines / elapsed,
+                "mb_per_second": size / 1e6 / elapsed,
+                "stages": {
+                    **timer.totals,
+                    "read": elapsed - sum(timer.totals.values()),
+                },
+            }
+    return best
+
+
+def bench_peak_memory(path: Path) -> int:
+    """讀取與解析過程的峰值記憶體"""
+    tracemalloc.start()
+    try:
+        run_pipeline(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_match(lines: list[bytes], repeat: int) -> float:
+    """單純逐行分派解析的吞吐量 (行/秒)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for line in lines:
+            match_log_line(line)
+        best = min(best, time.perf_counter() - started)
+    return len(lines) / best
+
+
+def bench_state(event_lines: list[bytes], repeat: int) -> float:
+    """每筆事件後立即更新狀態的吞吐量 (事件/秒)"""
+    best = float("inf")
+    for _ in range(repeat):
+        processor = LogProcessor(Path("."))
+        started = time.perf_counter()
+        for line in event_lines:
+            processor.process_content(line)
+        best = min(best, time.perf_counter() - started)
+    return len(event_lines) / best
+
+
+def bench_items(repeat: int, count: int = 20000) -> float:
+    """物品列表解析的吞吐量 (次/秒)"""
+    names = sorted(ITEMS)
+    samples = [", ".join(names[i % len(names) : i % len(names) + 4]) for i in range(count)]
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for sample in samples:
+            parse_items(sample)
+        best = min(best, time.perf_counter() - started)
+    return count / best
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense parser benchmark")
+    parser.add_argument(
+        "--log", type=Path, help="benchmark an existing log instead of a synthetic one"
+    )
+    parser.add_argument(
+        "--size", type=float, default=50, help="synthetic log size in MB (default: 50)"
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.002, help="SlashCo event ratio per line"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per measurement, best is reported"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])  # 讀取週期會排入計時器
+
+    with tempfile.TemporaryDirectory(prefix="slashco_bench_") as base:
+        if args.log:
+            path = args.log
+        else:
+            generator = LogGenerator(args.density, seed=args.seed)
+            path = Path(base) / "output_log_benchmark.txt"
+            path.write_bytes(generator.generate(int(args.size * 1e6)).encode("utf-8"))
+
+        data = path.read_bytes()
+        lines = data.splitlines()
+        event_lines = [line for line in lines if match_log_line(line)]
+
+        pipeline = bench_pipeline(path, len(lines), args.repeat)
+        report = {
+            "input": {"bytes": len(data), "lines": len(lines), "events": len(event_lines)},
+            "pipeline": pipeline,
+            "peak_memory_bytes": bench_peak_memory(path),
+            "match_lines_per_second": bench_match(lines, args.repeat),
+            "state_events_per_second": bench_state(event_lines, args.repeat),
+            "parse_items_per_second": bench_items(args.repeat),
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    stages = pipeline["stages"]
+    print(
+        f"input      {report['input']['bytes'] / 1e6:.1f} MB, {report['input']['lines']:,} lines,"
+        f" {report['input']['events']:,} events",
+        f"pipeline   {pipeline['seconds']:.3f}s | {pipeline['lines_per_second']:,.0f} lines/s,"
+        f" {pipeline['mb_per_second']:,.1f} MB/s",
+        "stages     " + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in stages.items()),
+        f"peak mem   {report['peak_memory_bytes'] / 1e6:.1f} MB",
+        f"match      {report['match_lines_per_second']:,.0f} lines/s",
+        f"state      {report['state_events_per_second']:,.0f} events/s",
+        f"items      {report['parse_items_per_second']:,.0f} lists/s",
+        sep="\n",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+歷史日誌索引: 以多行程平行解析目錄內所有 output_log_*.txt, 將每局資訊寫入對局歷史資料庫
+每個檔案記錄檢查點 (大小, mtime, 位移), 重新執行時只處理新增或變大的檔案
+
+python -m Modules.tools.HistoryIndexer --log-dir "%USERPROFILE%/AppData/LocalLow/VRChat/VRChat"
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed  # 僅開發工具使用 (打包時已排除)
+
+from ..core import SessionHistory
+from ..utils import EventKind, match_log_line
+from ..bootstrap import (
+    os,
+    sys,
+    mmap,
+    time,
+    argparse,
+    Path,
+    VRC_LOG_DIR,
+    HISTORY_DB_PATH,
+    LOG_READ_CHUNK_SIZE,
+)
+
+
+class RoundExtractor:
+    """以與 LogProcessor 相同的規則判斷對局, 將事件轉為 SessionHistory 的寫入操作"""
+
+    def __init__(self, name: str, offset: int, standard_timestamp: int, reset_mark: bool):
+        self.name = name
+        self.standard_timestamp = standard_timestamp
+        self.reset_mark = reset_mark
+        self.info = {}  # 地圖 / 殺手 / 物品, 都出現後才算一筆對局資訊
+
+        # 不同檔案的操作會交錯寫入, 先指定要接續的對局
+        self.operations = [("resume", name if offset else None)]
+
+    def feed(self, line: bytes):
+        for event in match_log_line(line):
+            kind = event.kind
+
+            if kind is EventKind.INIT:
+                self.reset_mark = False
+                self.standard_timestamp = event.timestamp
+                self.info.clear()
+                self.operations.append(("start", self.name, event.timestamp))
+
+            elif kind is EventKind.GENERATOR:
+                if not self.reset_mark and event.timestamp > self.standard_timestamp:
+                    self.operations.append(
+                        ("generator", event.timestamp, event.index, event.field, event.value)
+                    )
+
+            elif kind is EventKind.RESET:
+                if event.timestamp > self.standard_timestamp:
+                    self.reset_mark = True
+                    self.operations.append(("reset", event.timestamp))
+
+            else:
+                self.info[kind] = event
+
+        if len(self.info) == 3:
+            info = self.info
+            timestamp = max(event.timestamp for event in info.values())
+            if timestamp >= self.standard_timestamp:
+                self.operations.append(
+                    (
+                        "info",
+                        self.name,
+                        timestamp,
+                        info[EventKind.MAP].value,
+                        info[EventKind.SLASHER].value,
+                        info[EventKind.ITEMS].value,
+                    )
+                )
+            info.clear()
+
+
+def index_file(
+    path: str, offset: int = 0, standard_timestamp: int = 0, reset_mark: bool = False
+) -> dict:
+    """(工作行程) 從位移處解析到最後一個完整行, 回傳寫入操作與新的檢查點"""
+    name = Path(path).name
+    extractor = RoundExtractor(name, offset, standard_timestamp, reset_mark)
+    lines = 0
+
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        end = offset
+
+        if stat.st_size > offset:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b"\n", offset) + 1 or offset  # 最後一行可能尚未寫完
+
+                start = offset
+                while start < end:
+                    # 區塊結尾對齊到換行, 避免行被切斷
+                    stop = mm.find(b"\n", min(start + LOG_READ_CHUNK_SIZE, end) - 1) + 1
+                    for line in mm[start:stop].splitlines():
+                        extractor.feed(line)
+                        lines += 1
+                    start = stop
+
+    extractor.operations.append(
+        (
+            "checkpoint",
+            name,
+            stat.st_size,
+            stat.st_mtime_ns,
+            end,
+            extractor.standard_timestamp,
+            extractor.reset_mark,
+        )
+    )
+    return {"operations": extractor.operations, "lines": lines, "bytes": end - offset}
+
+
+def pending_files(log_dir: Path, checkpoints: dict[str, tuple], full: bool = False) -> list[tuple]:
+    """
+    找出需要處理的檔案與續讀的起點, 未變更的檔案略過, 變小 (被重建) 的檔案從頭處理
+    工作為 (路徑, 位移, 對局開始時間, 重置標記, 檔案大小); 期間被刪除的檔案直接略過
+    """
+    jobs = []
+    for path in sorted(log_dir.glob("output_log_*.txt")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        checkpoint = None if full else checkpoints.get(path.name)
+
+        if checkpoint is None:
+            jobs.append((str(path), 0, 0, False, stat.st_size))
+            continue
+
+        size, mtime_ns, offset, standard_timestamp, reset_mark = checkpoint
+        if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+            continue
+        if stat.st_size < offset:
+            jobs.append((str(path), 0, 0, False, stat.st_size))
+        else:
+            jobs.append((str(path), offset, standard_timestamp, bool(reset_mark), stat.st_size))
+
+    # 大檔案 (待處理的部分) 先排入, 讓各行程的工作量較平均
+    jobs.sort(key=lambda job: job[4] - job[1], reverse=True)
+    return jobs
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense parallel history indexer")
+    parser.add_argument(
+        "--log-dir", type=Path, default=VRC_LOG_DIR, help="directory of output_log_*.txt"
+    )
+    parser.add_argument("--db", type=Path, default=HISTORY_DB_PATH, help="history database path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument(
+        "--full", action="store_true", help="ignore checkpoints and re-index every file"
+    )
+    args = parser.parse_args(argv)
+
+    history = SessionHistory(args.db)
+    jobs = []
+    total_lines = total_bytes = 0
+    started = time.perf_counter()
+    try:
+        jobs = pending_files(args.log_dir, history.checkpoints(), args.full)
+
+        # 每個檔案交給一個工作行程, 完成後由背景寫入執行緒以交易寫入
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {executor.submit(index_file, *job[:4]): job[0] for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except OSError as e:
+                    print(f"{Path(futures[future]).name}: {e}", file=sys.stderr)
+                    continue
+
+                history.extend(result["operations"])
+                history.flush()
+                total_lines += result["lines"]
+                total_bytes += result["bytes"]
+    finally:
+        history.close()
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    print(
+        f"{len(jobs)} files indexed, {total_lines} lines,"
+        f" {total_bytes / 1e6:.1f} MB in {elapsed:.3f}s"
+        f" | {total_bytes / 1e6 / elapsed:,.1f} MB/s, {history.failed_batches} failed batches",
+        file=sys.stderr,
+    )
+    return 1 if history.failed_batches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
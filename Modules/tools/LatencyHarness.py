@@ -0,0 +1,302 @@
+"""
+端到端延遲測試: 從日誌寫入到 OSC 封包送達的時間
+在暫存日誌目錄啟動與主視窗相同的管線 (工作執行緒解析 -> 主執行緒 -> OscSender),
+由獨立的寫入行程附加帶時間戳的發電機事件, 並以本機 UDP socket 代替 VRChat 接收 OSC
+依追蹤方式 (檔案變更通知 / 固定間隔輪詢) 與寫入速率回報 p50 / p95 / p99 延遲與吞吐量
+
+python -m Modules.tools.LatencyHarness --modes watch poll:50 poll:500 --rates 20 200 0 --count 500
+"""
+
+import tempfile  # 僅開發工具使用, 不放進 bootstrap
+import subprocess
+from pythonosc.osc_packet import OscPacket, ParseError
+
+from ..core import LogTailer, LogProcessor, OscSender, osc_parameters
+from ..bootstrap import (
+    sys,
+    json,
+    time,
+    socket,
+    argparse,
+    threading,
+    Path,
+    QTimer,
+    QThread,
+    QObject,
+    datetime,
+    QCoreApplication,
+    LOG_UPDATE_INTERVAL,
+    LOG_WATCH_SAFETY_INTERVAL,
+)
+
+FUEL_ADDRESS = "/avatar/parameters/GENERATOR1_FUEL"
+
+# 寫入行程: 第 n 筆事件寫入 REMAINING = 4 - n (送出的 GENERATOR1_FUEL 即為 n)
+# 並記錄每筆寫入完成的時間
+# perf_counter 在 Windows / Linux / macOS 皆為系統共用的單調時鐘, 可跨行程比較
+WRITER_SCRIPT = """
+import sys, json, time
+from datetime import datetime
+
+path, times_path = sys.argv[1:3]
+count, rate, noise = int(sys.argv[3]), float(sys.argv[4]), int(sys.argv[5])
+filler = " Log        -  [Behaviour] OnPlayerJoined Mika\\n"
+written = []
+
+with open(path, "ab", buffering=0) as log:
+    started = time.perf_counter()
+    for seq in range(1, count + 1):
+        if rate:
+            delay = started + seq / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        stamp = datetime.now().strftime("%Y.%m.%d %H:%M:%S")
+        line = (
+            f"{stamp} Log        -  SC_generator1 Progress check. "
+            f"Last REMAINING value: {5 - seq}, updated REMAINING value: {4 - seq}\\n"
+        )
+        log.write(((stamp + filler) * noise + line).encode("utf-8"))
+        written.append(time.perf_counter())
+
+with open(times_path, "w") as f:
+    json.dump(written, f)
+"""
+
+
+class OscReceiver:
+    """代替 VRChat 的本機 UDP 接收端, 記錄 GENERATOR1_FUEL 的值與收到的時間"""
+
+    def __init__(self):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.settimeout(0.1)
+        self.port = self.socket.getsockname()[1]
+
+        self.received: list[tuple[float, int]] = []  # (收到時間, 值), list.append 為原子操作
+        self.packets = 0
+        self.is_running = True
+
+        self.thread = threading.Thread(target=self._run, name="OscReceiver", daemon=True)
+        self.thread.start()
+
+    def reset(self):
+        self.received = []
+        self.packets = 0
+
+    def latest(self) -> int:
+        return self.received[-1][1] if self.received else 0
+
+    def close(self):
+        self.is_running = False
+        self.thread.join(timeout=1)
+        self.socket.close()
+
+    def _run(self):
+        while self.is_running:
+            try:
+                data = self.socket.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            arrived = time.perf_counter()
+
+            try:
+                messages = OscPacket(data).messages
+            except ParseError:
+                continue
+            self.packets += 1
+            for timed in messages:
+                if timed.message.address == FUEL_ADDRESS:
+                    self.received.append((arrived, timed.message.params[0]))
+
+
+class Pipeline(QObject):
+    """與主視窗相同的配置: LogTailer 在工作執行緒, 批次事件在主執行緒轉為 OSC"""
+
+    def __init__(self, log_dir: Path, osc_port: int, watch: bool, poll_interval: int):
+        super().__init__()
+        self.osc_sender = OscSender("127.0.0.1", osc_port)
+        self.log_processor = LogProcessor(log_dir, batch_signals=True)
+        self.log_processor.events_batched.connect(self._on_events_batched)
+
+        self.logic_thread = QThread()
+        self.log_tailer = LogTailer([self.log_processor], watch, poll_interval)
+        self.log_tailer.moveToThread(self.logic_thread)
+        self.logic_thread.started.connect(self.log_tailer.run)
+
+    def start(self):
+        self.logic_thread.start()
+
+    def close(self):
+        self.log_tailer.stop()
+        self.logic_thread.quit()
+        self.logic_thread.wait()
+        self.osc_sender.close()
+
+    def _on_events_batched(self, events: list, _emitted_at: float):
+        for name, args in events:
+            for param, value in osc_parameters(name, args):
+                self.osc_sender.send(param, value)
+        self.osc_sender.flush()
+
+
+def parse_mode(text: str) -> tuple[bool, int]:
+    """watch: 檔案變更通知 (保底輪詢為預設值); poll:MS: 停用通知, 每 MS 毫秒輪詢"""
+    if text == "watch":
+        return True, LOG_UPDATE_INTERVAL
+    kind, _, interval = text.partition(":")
+    if kind != "poll" or not interval.isdigit() or int(interval) <= 0:
+        raise argparse.ArgumentTypeError("mode must be 'watch' or 'poll:MS'")
+    return False, int(interval)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """最近排名法, values 需已排序"""
+    if not values:
+        return 0.0
+    rank = -(-len(values) * percent // 100)  # 無條件進位
+    return values[max(int(rank) - 1, 0)]
+
+
+def summarize(written: list[float], received: list[tuple[float, int]]) -> dict:
+    """
+    第 n 筆事件的延遲 = 第一個值 >= n 的封包送達時間 - 寫入時間
+    同一週期的多筆事件只會送出最新的值, 較舊的事件視為隨該封包一起送達 (玩家看到的延遲)
+    """
+    latencies = []
+    for arrived, value in received:
+        while len(latencies) < min(value, len(written)):
+            latencies.append(arrived - written[len(latencies)])
+
+    delivered = len(latencies)
+    latencies.sort()
+    duration = received[-1][0] - written[0] if received else 0.0
+
+    return {
+        "events": len(written),
+        "delivered": delivered,
+        "packets": len(received),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "write_rate": (len(written) - 1) / (written[-1] - written[0]) if len(written) > 1 else 0.0,
+        "throughput": delivered / duration if duration > 0 else 0.0,
+    }
+
+
+def run_case(
+    app: QCoreApplication,
+    receiver: OscReceiver,
+    log_dir: Path,
+    mode: str,
+    count: int,
+    rate: float,
+    noise: int,
+) -> dict:
+    watch, poll_interval = parse_mode(mode)
+    log_dir.mkdir()
+
+    # 預先建立日誌並寫入一局的開頭, 之後的發電機事件才會被視為本局進度
+    log_file = log_dir / f"output_log_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
+    started = datetime.fromtimestamp(time.time() - 60).strftime("%Y.%m.%d %H:%M:%S")
+    log_file.write_text(f"{started} Log        -  Generators reset.\n", encoding="utf-8")
+
+    receiver.reset()
+    pipeline = Pipeline(log_dir, receiver.port, watch, poll_interval)
+    pipeline.start()
+
+    def wait(milliseconds: int):
+        QTimer.singleShot(milliseconds, app.quit)
+        app.exec()
+
+    wait(max(poll_interval, 200) + 100)  # 等待附加到日誌 (第一次輪詢)
+
+    times_path = log_dir / "written.json"
+    writer = subprocess.Popen(
+        [sys.executable, "-c", WRITER_SCRIPT, str(log_file), str(times_path)]
+        + [str(count), str(rate), str(noise)]
+    )
+
+    # 寫入結束後, 最多再等待一個輪詢週期 (含保底輪詢) 讓最後的事件送達
+    settle = (LOG_WATCH_SAFETY_INTERVAL if watch else poll_interval) / 1000 + 1.0
+    deadline = None
+
+    def check():
+        nonlocal deadline
+        if writer.poll() is None:
+            return
+        deadline = deadline or time.perf_counter() + settle
+        if receiver.latest() >= count or time.perf_counter() > deadline:
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(20)
+    app.exec()
+    timer.stop()
+    pipeline.close()
+
+    written = json.loads(times_path.read_text())
+    result = summarize(written, list(receiver.received))
+    result.update(mode=mode, rate=rate, noise=noise, returncode=writer.returncode)
+    return result
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense end-to-end latency harness")
+    parser.add_argument(
+        "--modes", nargs="+", default=["watch", "poll:100", "poll:500"], help="watch, poll:MS"
+    )
+    parser.add_argument(
+        "--rates", nargs="+", type=float, default=[20.0, 0.0], help="events per second, 0 = max"
+    )
+    parser.add_argument("--count", type=int, default=300, help="events written per run")
+    parser.add_argument("--noise", type=int, default=20, help="unrelated lines before each event")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    for mode in args.modes:
+        try:
+            parse_mode(mode)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    receiver = OscReceiver()
+    results = []
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="slashco_latency_") as base:
+            for number, (mode, rate) in enumerate(
+                ((mode, rate) for mode in args.modes for rate in args.rates), 1
+            ):
+                case_dir = Path(base) / f"run{number}"
+                results.append(
+                    run_case(app, receiver, case_dir, mode, args.count, rate, args.noise)
+                )
+                if not args.json:
+                    result = results[-1]
+                    print(
+                        f"{mode:<10} {'max' if not rate else f'{rate:g}/s':>8}"
+                        f" | {result['delivered']}/{result['events']} events"
+                        f" in {result['packets']} packets"
+                        f" | p50 {result['p50_ms']:7.1f}  p95 {result['p95_ms']:7.1f}"
+                        f"  p99 {result['p99_ms']:7.1f}  max {result['max_ms']:7.1f} ms"
+                        f" | write {result['write_rate']:,.0f}/s"
+                        f" delivered {result['throughput']:,.0f}/s",
+                        flush=True,
+                    )
+    finally:
+        receiver.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    lost = any(result["delivered"] < result["events"] for result in results)
+    return 1 if lost else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+合成 VRChat 日誌產生器: 依指定大小與事件密度輸出 output_log_*.txt 格式的內容
+
+python -m Modules.tools.LogGenerator output_log_bench.txt --size 100 --density 0.002
+"""
+
+import random  # 僅開發工具使用, 不放進 bootstrap (打包時已排除)
+
+from ..bootstrap import sys, argparse, Path, datetime
+from ..resources import SLASHERS, GAME_MAPS
+from ..resources.mappings.Items import ITEMS
+
+NOISE_LINES = (
+    "Log        -  [Behaviour] OnPlayerJoined {name}",
+    "Log        -  [Behaviour] OnPlayerLeft {name}",
+    "Log        -  [Network Processing] RPC invoked SyncPosition on {name}",
+    "Debug      -  [AssetBundleDownloadManager] Unpacking asset bundle {number}",
+    "Warning    -  [Always] Slow frame detected: {number} ms",
+    "Error      -  [UdonBehaviour] An exception occurred during Udon execution,"
+    " this UdonBehaviour will be halted.",
+)
+STACK_LINES = (
+    "  at VRC.Udon.VM.UdonVM.Interpret () [0x00000] in <00000000000000000000000000000000>:0",
+    "  at UnityEngine.Debug:LogError(Object)",
+)
+PLAYER_NAMES = ("Mika", "Nyan", "Kuro", "Shiro", "Hana", "Rin")
+
+
+class LogGenerator:
+    """產生帶有雜訊、超長 JSON 行與多局發電機進度的合成日誌"""
+
+    def __init__(
+        self,
+        density: float = 0.002,
+        json_ratio: float = 0.005,
+        json_size: int = 16384,
+        seed: int = 0,
+    ):
+        self.density = density  # 每行為 SlashCo 事件的機率
+        self.json_ratio = json_ratio  # 每行為超長 JSON 的機率
+        self.json_size = json_size
+        self.random = random.Random(seed)
+
+        self.clock = datetime(2024, 5, 1, 20, 0, 0).timestamp()
+        self.round_events: list[str] = []
+        self.stats = {"lines": 0, "events": 0, "rounds": 0}
+
+    def _timestamp(self) -> str:
+        self.clock += self.random.random() * 0.5
+        return datetime.fromtimestamp(self.clock).strftime("%Y.%m.%d %H:%M:%S")
+
+    def _new_round(self) -> list[str]:
+        """一局: 初始化 -> 對局資訊 -> 兩台發電機的電池與加油進度 -> (偶爾) 再次重置"""
+        rand = self.random
+        items = ", ".join(rand.sample(sorted(ITEMS), k=rand.randint(1, 4)))
+        events = [
+            "Log        -  Generators reset.",
+            f"Log        -  Played Map: {rand.choice(sorted(GAME_MAPS))}, "
+            f"Slasher: {rand.choice(sorted(SLASHERS))}, Selected Items: {items}, Difficulty: 2",
+        ]
+
+        for gen in rand.sample(("generator1", "generator2"), k=2):
+            events.append(
+                f"Log        -  SC_{gen} Progress check. "
+                "Last HAS_BATTERY value: False, updated HAS_BATTERY value: True"
+            )
+            for remaining in range(4, 0, -1):
+                events.append(
+                    f"Log        -  SC_{gen} Progress check. "
+                    f"Last REMAINING value: {remaining}, updated REMAINING value: {remaining - 1}"
+                )
+
+        if rand.random() < 0.3:
+            events.append("Log        -  Generators reset again.")
+
+        self.stats["rounds"] += 1
+        return events
+
+    def _noise(self) -> str:
+        rand = self.random
+        roll = rand.random()
+
+        if roll < self.json_ratio:
+            body = ",".join(
+                f'"k{i}":{rand.randint(0, 1 << 30)}' for i in range(self.json_size // 16)
+            )
+            return f"{self._timestamp()} Log        -  [API] Received JSON {{{body}}}"
+        if roll < self.json_ratio + 0.05:
+            return rand.choice(STACK_LINES)
+        if roll < self.json_ratio + 0.07:
+            return ""
+
+        template = rand.choice(NOISE_LINES)
+        text = template.format(name=rand.choice(PLAYER_NAMES), number=rand.randint(0, 99999))
+        return f"{self._timestamp()} {text}"
+
+    def lines(self):
+        """無限產生日誌行"""
+        while True:
+            if self.random.random() < self.density:
+                if not self.round_events:
+                    self.round_events = self._new_round()
+                self.stats["events"] += 1
+                line = f"{self._timestamp()} {self.round_events.pop(0)}"
+            else:
+                line = self._noise()
+
+            self.stats["lines"] += 1
+            yield line
+
+    def generate(self, size: int) -> str:
+        """產生至少 size 位元組 (UTF-8) 的日誌內容"""
+        parts = []
+        total = 0
+        for line in self.lines():
+            parts.append(line)
+            total += len(line) + 1
+            if total >= size:
+                break
+        return "\n".join(parts) + "\n"
+
+    def write(self, path: Path, size: int, chunk_size: int = 1 << 20):
+        """分塊寫入檔案, 避免一次在記憶體中保留整個日誌"""
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            written = 0
+            while written < size:
+                chunk = self.generate(min(chunk_size, size - written))
+                f.write(chunk)
+                written += len(chunk.encode("utf-8"))
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Synthetic VRChat output_log generator")
+    parser.add_argument("output", type=Path, help="output log path")
+    parser.add_argument("--size", type=float, default=50, help="size in MB (default: 50)")
+    parser.add_argument("--density", type=float, default=0.002, help="SlashCo event ratio per line")
+    parser.add_argument("--json-ratio", type=float, default=0.005, help="long JSON line ratio")
+    parser.add_argument("--json-size", type=int, default=16384, help="long JSON line length")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    generator = LogGenerator(args.density, args.json_ratio, args.json_size, args.seed)
+    generator.write(args.output, int(args.size * 1e6))
+    print(f"{args.output}: {generator.stats}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+啟動效能分析: 量測匯入時間與首次顯示視窗的時間, 並檢查延遲載入的模組是否在啟動時就被匯入
+
+python -m Modules.tools.StartupProfile --repeat 5 --budget 300
+"""
+
+import subprocess  # 僅開發工具使用, 不放進 bootstrap
+
+from ..bootstrap import sys, json, time, argparse, Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+IMPORT_BUDGET_MS = 300  # import Modules 的預設時間預算 (毫秒)
+DEFERRED_MODULES = ("pythonosc", "asyncio", "PySide6.QtNetwork")  # 首次顯示視窗前不應載入
+
+# 在子行程中建立主視窗, 事件循環第一次執行時 (視窗已顯示) 回報各階段耗時
+FIRST_WINDOW_SCRIPT = """
+import sys, json, time
+started = time.perf_counter()
+
+import Modules
+imported = time.perf_counter()
+
+from importlib.util import spec_from_loader, module_from_spec
+from importlib.machinery import SourceFileLoader
+
+loader = SourceFileLoader("SlashcoSense", "SlashcoSense.pyw")
+main = module_from_spec(spec_from_loader(loader.name, loader))
+loader.exec_module(main)
+
+app = Modules.QApplication(sys.argv)
+window = main.SlashcoSenseMainWindow()
+window.show()
+shown = time.perf_counter()
+
+def first_frame():
+    ready = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "window_ms": (shown - imported) * 1000,
+        "first_frame_ms": (ready - started) * 1000,
+        "deferred_loaded": [name for name in %r if name in sys.modules],
+    }), flush=True)
+    window.close()
+    app.quit()
+
+Modules.QTimer.singleShot(0, first_frame)
+app.exec()
+""" % (DEFERRED_MODULES,)
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """解析 -X importtime 的輸出: 自身耗時、累計耗時 (微秒) 與巢狀深度"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        records.append(
+            {
+                "name": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return records
+
+
+def profile_imports(target: str = "Modules") -> list[dict]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def profile_first_window() -> dict:
+    """從啟動直譯器到主視窗顯示後第一次事件循環的時間"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_WINDOW_SCRIPT],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report["process_ms"] = (time.perf_counter() - started) * 1000
+    return report
+
+
+def median(values: list[float]) -> float:
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense startup profile")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per measurement, median is reported"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=IMPORT_BUDGET_MS, help="import budget in ms"
+    )
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument(
+        "--no-window", action="store_true", help="skip the first window measurement"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    # 以總耗時居中的一次作為代表, 列出自身耗時最久的模組
+    runs = sorted(
+        (profile_imports() for _ in range(args.repeat)),
+        key=lambda records: records[-1]["cumulative_us"],
+    )
+    typical = runs[len(runs) // 2]
+    slowest = sorted(typical, key=lambda record: record["self_us"], reverse=True)
+
+    imported = {record["name"] for records in runs for record in records}
+    report = {
+        "import_ms": typical[-1]["cumulative_us"] / 1000,
+        "budget_ms": args.budget,
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in imported],
+        "slowest": slowest[: args.top],
+    }
+
+    if not args.no_window:
+        windows = [profile_first_window() for _ in range(args.repeat)]
+        report["first_window"] = {
+            key: median([window[key] for window in windows])
+            for key in ("import_ms", "window_ms", "first_frame_ms", "process_ms")
+        }
+        for window in windows:
+            report["deferred_loaded"] += window["deferred_loaded"]
+        report["deferred_loaded"] = sorted(set(report["deferred_loaded"]))
+
+    over_budget = report["import_ms"] > args.budget or report["deferred_loaded"]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 1 if over_budget else 0
+
+    print(f"import     {report['import_ms']:.1f} ms (budget {args.budget:.0f} ms)")
+    if "first_window" in report:
+        window = report["first_window"]
+        print(
+            f"window     process {window['process_ms']:.1f} ms"
+            f" | import {window['import_ms']:.1f} ms, build {window['window_ms']:.1f} ms,"
+            f" first frame {window['first_frame_ms']:.1f} ms"
+        )
+    if report["deferred_loaded"]:
+        print(f"deferred   {', '.join(report['deferred_loaded'])} loaded at startup")
+    else:
+        print("deferred   ok")
+    print("slowest    self ms | cumulative ms | module")
+    for record in report["slowest"]:
+        self_ms, cumulative_ms = record["self_us"] / 1000, record["cumulative_us"] / 1000
+        print(f"{self_ms:>14.1f} | {cumulative_ms:>13.1f} | {record['name']}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
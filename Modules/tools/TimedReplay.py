@@ -0,0 +1,132 @@
+"""
+定時重播: 將錄製的 output_log_*.txt 依行內時間戳的間隔逐段寫入暫存日誌目錄
+供執行中的 SlashcoSense 即時讀取; 可調整倍速 (1x, 10x, max 為不等待)
+用來重現與時序有關的問題, 以及對信號傳遞、介面更新與 OSC 輸出施加真實的突發負載
+
+python -m Modules.tools.TimedReplay output_log_xxx.txt --log-dir replay --speed 10
+python SlashcoSense.pyw --log-dir replay
+"""
+
+import tempfile  # 僅開發工具使用, 不放進 bootstrap
+
+from ..bootstrap import re, sys, time, argparse, Path, datetime
+
+# VRChat 每行以時間戳開頭, 沒有時間戳的行 (例如堆疊追蹤) 與前一行同時寫入
+LINE_TIMESTAMP = re.compile(rb"^(\d{4})\.(\d{2})\.(\d{2}) (\d{2}):(\d{2}):(\d{2})")
+
+
+def read_groups(path: Path):
+    """逐行讀取, 依時間戳 (秒) 分組, 產生 (秒數, 該秒的所有行)"""
+    current, stamp, lines = None, None, []
+    with open(path, "rb") as f:
+        for line in f:
+            match = LINE_TIMESTAMP.match(line)
+            # 同一秒的行時間戳文字相同, 只在變化時才轉換
+            if match and match.group(0) != stamp:
+                if lines:
+                    yield current, b"".join(lines)
+                    lines = []
+                stamp = match.group(0)
+                current = datetime(*map(int, match.groups())).timestamp()
+            lines.append(line)
+
+    if lines:
+        yield current, b"".join(lines)
+
+
+def parse_speed(text: str) -> float:
+    """倍速, max 表示不等待 (以 0 表示)"""
+    if text == "max":
+        return 0.0
+    speed = float(text)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+
+def replay(
+    source: Path, target: Path, speed: float = 1.0, max_gap: float = 0, verbose: bool = False
+) -> dict:
+    """寫入 target 並回傳統計 (行數, 分組數, 實際耗時, 落後排程的最大與平均時間)"""
+    groups = lines = 0
+    lag_total = lag_max = 0.0
+    log_elapsed = 0.0  # 重播位置對應的日誌經過時間 (已套用 max_gap)
+    previous = None
+
+    started = time.perf_counter()
+    with open(target, "ab", buffering=0) as output:
+        for seconds, data in read_groups(source):
+            if previous is not None and seconds is not None:
+                gap = max(seconds - previous, 0)
+                log_elapsed += min(gap, max_gap) if max_gap else gap
+            if seconds is not None:
+                previous = seconds
+
+            if speed:
+                due = started + log_elapsed / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    lag_total -= delay
+                    lag_max = max(lag_max, -delay)
+
+            output.write(data)  # 同一秒的行一次寫入, 與 VRChat 的突發寫入相同
+            groups += 1
+            lines += data.count(b"\n")
+
+            if verbose and groups % 100 == 0:
+                print(f"\r{lines} lines, log +{log_elapsed:,.0f}s", end="", file=sys.stderr)
+
+    if verbose:
+        print(file=sys.stderr)
+
+    return {
+        "groups": groups,
+        "lines": lines,
+        "log_seconds": log_elapsed,
+        "elapsed": time.perf_counter() - started,
+        "lag_max": lag_max,
+        "lag_mean": lag_total / groups if groups else 0.0,
+    }
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="SlashcoSense timed log replay")
+    parser.add_argument("log", type=Path, help="recorded output_log_*.txt")
+    parser.add_argument("--log-dir", type=Path, help="scratch log directory (default: temp dir)")
+    parser.add_argument("--speed", type=parse_speed, default=1.0, help="playback speed: 1, 10, max")
+    parser.add_argument(
+        "--max-gap", type=float, default=0, help="clip idle gaps longer than this many log seconds"
+    )
+    parser.add_argument("--delay", type=float, default=0, help="seconds to wait before starting")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show progress")
+    args = parser.parse_args(argv)
+
+    log_dir = args.log_dir or Path(tempfile.mkdtemp(prefix="slashco_replay_"))
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    # 新的日誌檔名與 VRChat 相同格式, 監控中的程式會視為最新的日誌並切換過去
+    target = log_dir / f"output_log_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
+    print(f"replaying {args.log.name} into {target}", file=sys.stderr)
+    time.sleep(args.delay)
+
+    try:
+        result = replay(args.log, target, args.speed, args.max_gap, args.verbose)
+    except KeyboardInterrupt:
+        print("\ninterrupted", file=sys.stderr)
+        return 130
+
+    elapsed = max(result["elapsed"], 1e-9)
+    log_seconds = result["log_seconds"]
+    print(
+        f"{result['lines']} lines in {result['groups']} bursts,"
+        f" {log_seconds:,.0f} log seconds in {elapsed:.3f}s ({log_seconds / elapsed:,.1f}x)"
+        f" | lag max {result['lag_max'] * 1000:.1f} ms, mean {result['lag_mean'] * 1000:.2f} ms",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
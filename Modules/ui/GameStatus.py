@@ -1,23 +1,18 @@
 from ..language import transl
+from ..core import ImageCache, IconRenderer
 from ..bootstrap import (
     Qt,
     QFont,
     QLabel,
     QIcon,
-    Path,
     QGroupBox,
     Optional,
     QWidget,
     QHBoxLayout,
     QVBoxLayout,
-    QNetworkAccessManager,
-    QNetworkReply,
-    QUrl,
+    QByteArray,
+    QSize,
     QPixmap,
-    QPainter,
-    QPixmapCache,
-    QPainterPath,
-    QNetworkRequest,
     Signal,
 )
 
@@ -29,9 +24,19 @@ class GameStatusWidget(QGroupBox):
         super().__init__(transl("遊戲狀態"), parent)
         self.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
 
-        # 網路管理器，專門給這個組件用來載入殺手圖片
-        self.network_manager = QNetworkAccessManager(self)
-        self.network_manager.finished.connect(self._on_image_loaded)
+        # 圖片快取，本機沒有時才從網路載入殺手圖片
+        self.image_cache = ImageCache(self)
+        self.image_cache.image_ready.connect(self._on_image_loaded)
+        self.image_cache.image_failed.connect(self._on_image_failed)
+        self.current_url = ""
+        self.window_icon_url = ""
+
+        # 圓角圖片於背景執行緒解碼 / 縮放, 並依來源、尺寸、圓角與 DPR 快取
+        self.icon_renderer = IconRenderer(self)
+        self.icon_renderer.icon_ready.connect(self._on_icon_rendered)
+        self.icon_renderer.icon_failed.connect(self._on_icon_failed)
+        self.current_key = None
+        self.info_shown = False
 
         self._setup_ui()
 
@@ -76,114 +81,93 @@ class GameStatusWidget(QGroupBox):
         game_main_layout.addWidget(game_info_widget, 1)
         game_main_layout.addWidget(image_widget, 0)
 
+    def retranslate_ui(self):
+        """對局資訊由 LogProcessor 以新語言重新發送, 這裡只處理固定文字與預設值"""
+        self.setTitle(transl("遊戲狀態"))
+        if not self.info_shown:
+            self.map_label.setText(f"{transl('地圖')}: {transl('未知')}")
+            self.slasher_label.setText(f"{transl('殺手')}: {transl('未知')}")
+            self.items_label.setText(transl("生成物品: 無"))
+        if not self.current_url:
+            self.image_label.setText(transl("未知"))
+
     def update_info(self, map_name: str, slasher_name: str, items: str):
+        self.info_shown = True
         self.map_label.setText(f"{transl('地圖')}: \n{map_name}")
         self.slasher_label.setText(f"{transl('殺手')}: \n{slasher_name}")
         self.items_label.setText(f"{transl('生成物品')}: \n{items}")
 
-    def _rounded_pixmap(self, pixmap: QPixmap, radius: int) -> QPixmap:
-        size = pixmap.size()
-        rounded = QPixmap(size)
-        rounded.fill(Qt.GlobalColor.transparent)
+    def _image_key(self, url: str) -> tuple:
+        return IconRenderer.key(url, self.image_label.size(), 8, self.devicePixelRatioF())
 
-        painter = QPainter(rounded)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, size.width(), size.height(), radius, radius)
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.end()
+    def _window_icon_key(self, url: str) -> tuple:
+        return IconRenderer.key(url, QSize(64, 64), 32, self.devicePixelRatioF(), crop=True)
 
-        return rounded
+    def _on_image_failed(self, url: str):
+        if url == self.current_url:
+            self.image_label.setStyleSheet("")  # 恢復原本樣式
+            self.image_label.setText(transl("載入失敗"))
 
-    def _on_image_loaded(self, reply: QNetworkReply):
-        """圖片載入完成的回撥"""
+    def _on_image_loaded(self, url: str, data: QByteArray):
+        """圖片下載完成 (或背景預取發現更新) 的回撥, 重新於背景渲染"""
+        self.icon_renderer.invalidate(url)
 
-        url = reply.request().attribute(QNetworkRequest.Attribute.User)
-        self.image_label.setStyleSheet("")  # 恢復原本樣式
-
-        is_local = "http" not in url and Path(url).is_file()
-        pixmap = QPixmap()
-        loaded = False
-
-        if is_local:
-            loaded = pixmap.load(url)
-        elif reply.error() == QNetworkReply.NetworkError.NoError:
-            image_data = reply.readAll()
-            loaded = pixmap.loadFromData(image_data)
-
-        if not loaded:
-            if not url.lower().endswith(".ico"):  # .ico 載入失敗可不顯示錯誤
-                self.image_label.setText(transl("載入失敗"))
-            reply.deleteLater()
-            return
-
-        if url.lower().endswith(".ico"):
-            # 裁出中心正方形
-            w, h = pixmap.width(), pixmap.height()
-            side = min(w, h)
-            x = (w - side) // 2
-            y = (h - side) // 2
-            cropped = pixmap.copy(x, y, side, side)
-
-            # 縮放至 icon 尺寸
-            icon_size = 64
-            scaled = cropped.scaled(
-                icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
+        if url == self.window_icon_url:
+            self.icon_renderer.request(self._window_icon_key(url), data)
+        else:
+            self.icon_renderer.request(self._image_key(url), data)
 
-            # 製作圓形遮罩
-            circular = QPixmap(icon_size, icon_size)
-            circular.fill(Qt.transparent)
+    def _on_icon_rendered(self, key: tuple, pixmap: QPixmap):
+        """背景渲染完成, 只有仍是目前顯示的圖片時才換上"""
+        if key == self._window_icon_key(self.window_icon_url):
+            self.window_icon_ready.emit(QIcon(pixmap))
+        elif key == self.current_key:
+            self._show_pixmap(pixmap)
 
-            painter = QPainter(circular)
-            painter.setRenderHint(QPainter.Antialiasing)
-            path = QPainterPath()
-            path.addEllipse(0, 0, icon_size, icon_size)
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, scaled)
-            painter.end()
+    def _on_icon_failed(self, key: tuple):
+        if key == self.current_key:  # .ico 解碼失敗可不顯示錯誤
+            self._on_image_failed(self.current_url)
 
-            # 設定視窗圖示
-            self.window_icon_ready.emit(QIcon(circular))
+    def _show_pixmap(self, pixmap: QPixmap):
+        self.image_label.setPixmap(pixmap)
+        self.image_label.setStyleSheet("")  # 恢復原本樣式
 
+    def prerender(self, urls: list[str]):
+        """預先渲染本機已有的圖片, 對局開始時可直接取用"""
+        for url in urls:
+            data = self.image_cache.get(url)
+            if data is not None:
+                self.icon_renderer.request(self._image_key(url), data)
+
+    def load_window_icon(self, url: str):
+        """載入視窗圖示 (本機有快取時立即於背景渲染)"""
+        self.window_icon_url = url
+        data = self.image_cache.get(url)
+        if data is not None:
+            self.icon_renderer.request(self._window_icon_key(url), data)
         else:
-            if url:
-                QPixmapCache.insert(url, pixmap)
-
-            # 縮放圖片以適應標籤大小
-            scaled = pixmap.scaled(
-                self.image_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-
-            # 顯示圓角圖片
-            self.image_label.setPixmap(self._rounded_pixmap(scaled, radius=8))
-
-        reply.deleteLater()
+            self.image_cache.fetch(url)
 
     def set_image_url(self, url: str):
         """設定圖片URL（程式介面）"""
+        self.current_url = url
 
         if url:
-            # 先從 QPixmapCache 快取找
-            pixmap = QPixmap()
-            if QPixmapCache.find(url, pixmap):
-                scaled_pixmap = pixmap.scaled(
-                    self.image_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self.image_label.setPixmap(self._rounded_pixmap(scaled_pixmap, radius=8))
-                self.image_label.setStyleSheet("")
+            # 先找已渲染完成的圖片
+            self.current_key = self._image_key(url)
+            pixmap = self.icon_renderer.find(self.current_key)
+            if pixmap is not None:
+                self._show_pixmap(pixmap)
+                return
+
+            # 再從磁碟快取 / 內建圖片找, 於背景渲染完成後換上
+            data = self.image_cache.get(url)
+            if data is not None:
+                self.icon_renderer.request(self.current_key, data)
                 return
 
-            # 如果快取中沒有，才進行網路請求
-            request = QNetworkRequest(QUrl(url))
-            # 將URL儲存到請求中，方便回撥時使用
-            request.setAttribute(QNetworkRequest.Attribute.User, url)
-            self.network_manager.get(request)
+            # 本機都沒有，才進行網路請求
+            self.image_cache.fetch(url)
 
             # 設定載入中的樣式和文字
             self.image_label.clear()  # 清除之前的圖片
@@ -201,6 +185,7 @@ class GameStatusWidget(QGroupBox):
                 """
             )
         else:
+            self.current_key = None
             self.image_label.clear()
             self.image_label.setText(transl("未知"))
             self.image_label.setStyleSheet("")
@@ -13,13 +13,14 @@ class GeneratorStatusWidget(QGroupBox):
         gen_layout = QVBoxLayout(self)
         gen_layout.setSpacing(10)
 
+        self.gen_labels: list[tuple[QLabel, str]] = []
         self.gen1_progress, self.gen1_battery = self._create_gen_ui(gen_layout, "1")
         self.gen2_progress, self.gen2_battery = self._create_gen_ui(gen_layout, "2")
 
-        warning = QLabel(transl("發電機監控僅限非房主有效"))
-        warning.setObjectName("warningText")
-        warning.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        gen_layout.addWidget(warning)
+        self.warning_label = QLabel(transl("發電機監控僅限非房主有效"))
+        self.warning_label.setObjectName("warningText")
+        self.warning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        gen_layout.addWidget(self.warning_label)
 
     def _create_gen_ui(self, layout: QVBoxLayout, num: str):
         h_layout = QHBoxLayout()
@@ -28,6 +29,7 @@ class GeneratorStatusWidget(QGroupBox):
         label = QLabel(f"{transl('發電機')} {num}")
         label.setMinimumWidth(20)
         label.setFont(QFont("Microsoft YaHei", 11, QFont.Weight.Bold))
+        self.gen_labels.append((label, num))
 
         progress = ProgressBarWidget()
         progress.setMinimumWidth(250)
@@ -45,21 +47,26 @@ class GeneratorStatusWidget(QGroupBox):
         layout.addWidget(widget)
         return progress, battery
 
-    def update_generator(self, gen_name: str, var_type: str, new_value: Any):
+    def retranslate_ui(self):
+        self.setTitle(transl("發電機狀態"))
+        for label, num in self.gen_labels:
+            label.setText(f"{transl('發電機')} {num}")
+        self.warning_label.setText(transl("發電機監控僅限非房主有效"))
+
+    def update_generator(self, gen_index: int, var_type: str, new_value: Any):
         try:
             if var_type == "REMAINING":
                 filled = 4 - int(new_value)
                 progress = (filled * 100) // 4
-                if gen_name == "generator1":
+                if gen_index == 1:
                     self.gen1_progress.setValue(progress)
-                elif gen_name == "generator2":
+                elif gen_index == 2:
                     self.gen2_progress.setValue(progress)
             elif var_type == "HAS_BATTERY":
-                has_battery = str(new_value).lower() == "true"
-                battery_text = "🔋" if has_battery else "🪫"
-                if gen_name == "generator1":
+                battery_text = "🔋" if new_value is True else "🪫"
+                if gen_index == 1:
                     self.gen1_battery.setText(battery_text)
-                elif gen_name == "generator2":
+                elif gen_index == 2:
                     self.gen2_battery.setText(battery_text)
         except (ValueError, TypeError):
             pass
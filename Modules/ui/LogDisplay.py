@@ -1,22 +1,62 @@
 from ..language import transl
-from ..bootstrap import QGroupBox, QFont, Optional, QWidget, QVBoxLayout, QTextEdit, datetime
+from ..bootstrap import (
+    QGroupBox,
+    QFont,
+    QTimer,
+    Optional,
+    QWidget,
+    QVBoxLayout,
+    QPlainTextEdit,
+    deque,
+    datetime,
+    LOG_DISPLAY_MAX_LINES,
+    LOG_DISPLAY_FLUSH_INTERVAL,
+)
 
 
 class LogDisplayWidget(QGroupBox):
-    def __init__(self, parent: Optional[QWidget] = None):
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        max_lines: int = LOG_DISPLAY_MAX_LINES,
+        flush_interval: int = LOG_DISPLAY_FLUSH_INTERVAL,
+    ):
         super().__init__(transl("日誌監控"), parent)
         self.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
-        self._setup_ui()
 
-    def _setup_ui(self):
+        # 待顯示的訊息, 超過上限時自動捨棄最舊的
+        self.pending: deque[str] = deque(maxlen=max_lines)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self._flush)
+
+        self._setup_ui(max_lines)
+
+    def retranslate_ui(self):
+        self.setTitle(transl("日誌監控"))
+
+    def _setup_ui(self, max_lines: int):
         log_layout = QVBoxLayout(self)
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 10))
+        self.log_display.setMaximumBlockCount(max_lines)  # 只保留最新的行數, 文件不會無限成長
         log_layout.addWidget(self.log_display)
 
     def append_message(self, message: str):
         timestamp = datetime.now().strftime("[%H:%M:%S]")
-        self.log_display.append(f"{timestamp} {message}")
+        self.pending.append(f"{timestamp} {message}")
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def _flush(self):
+        """將短時間內累積的訊息一次寫入並捲動到底部"""
+        if not self.pending:
+            return
+
+        self.log_display.appendPlainText("\n".join(self.pending))
+        self.pending.clear()
+
         scrollbar = self.log_display.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
@@ -0,0 +1,72 @@
+from ..language import transl
+from ..core import Metrics
+from ..bootstrap import (
+    QGroupBox,
+    QFont,
+    QTimer,
+    Optional,
+    QWidget,
+    QVBoxLayout,
+    QPlainTextEdit,
+    METRICS_REFRESH_INTERVAL,
+)
+
+
+class MetricsPanelWidget(QGroupBox):
+    """偵錯用的效能指標面板, 只在顯示時定期讀取指標快照"""
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        parent: Optional[QWidget] = None,
+        refresh_interval: int = METRICS_REFRESH_INTERVAL,
+    ):
+        super().__init__(transl("效能指標"), parent)
+        self.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
+        self.metrics = metrics
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(refresh_interval)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self._setup_ui()
+
+    def retranslate_ui(self):
+        self.setTitle(transl("效能指標"))
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        self.metrics_display = QPlainTextEdit()
+        self.metrics_display.setReadOnly(True)
+        self.metrics_display.setFont(QFont("Consolas", 9))
+        self.metrics_display.setMinimumHeight(160)
+        layout.addWidget(self.metrics_display)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snapshot = self.metrics.snapshot()
+
+        lines = []
+        for (name, label), value in sorted(snapshot["values"].items()):
+            lines.append(f"{f'{name}{{{label}}}' if label else name:<40} {value:>14,}")
+
+        lines.append("")
+        lines.append(f"{'timer':<28} {'count':>8} {'avg ms':>10} {'max ms':>10} {'total s':>9}")
+        for name, (count, total, peak) in sorted(snapshot["timers"].items()):
+            lines.append(
+                f"{name:<28} {count:>8,} {total / count * 1000:>10.3f}"
+                f" {peak * 1000:>10.3f} {total:>9.3f}"
+            )
+
+        # 內容相同時不重設文字, 避免捲動位置跳動
+        text = "\n".join(lines)
+        if text != self.metrics_display.toPlainText():
+            self.metrics_display.setPlainText(text)
@@ -1,4 +1,4 @@
-from ..language import transl
+from ..language import transl, current_language, Names
 from ..bootstrap import (
     Qt,
     QFont,
@@ -9,6 +9,7 @@ from ..bootstrap import (
     QWidget,
     QHBoxLayout,
     QCheckBox,
+    QComboBox,
     QLineEdit,
     Signal,
     DEFAULT_OSC_PORT,
@@ -18,6 +19,7 @@ from ..bootstrap import (
 class OscSettingsWidget(QGroupBox):
     settings_changed = Signal(bool, int)
     log_visibility_changed = Signal(bool)
+    language_changed = Signal(str)
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(transl("OSC 設定"), parent)
@@ -40,11 +42,33 @@ class OscSettingsWidget(QGroupBox):
         self.port_input = QLineEdit(str(DEFAULT_OSC_PORT))
         self.port_input.setMaximumWidth(80)
 
+        # 語言選單 (以各語言的原文顯示)
+        self.language_combo = QComboBox()
+        self.language_combo.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        for lang, name in Names.items():
+            self.language_combo.addItem(name, lang)
+        self.language_combo.setCurrentIndex(self.language_combo.findData(current_language()))
+        self.language_combo.currentIndexChanged.connect(
+            lambda: self.language_changed.emit(self.language_combo.currentData())
+        )
+
+        self.port_label = QLabel(transl("埠號:"))
+        self.language_label = QLabel(transl("語言:"))
+
         osc_layout.addWidget(self.osc_enabled_checkbox)
         osc_layout.addWidget(self.osc_log_enabled_checkbox)
         osc_layout.addStretch()
-        osc_layout.addWidget(QLabel(transl("埠號:")))
+        osc_layout.addWidget(self.port_label)
         osc_layout.addWidget(self.port_input)
+        osc_layout.addWidget(self.language_label)
+        osc_layout.addWidget(self.language_combo)
+
+    def retranslate_ui(self):
+        self.setTitle(transl("OSC 設定"))
+        self.osc_enabled_checkbox.setText(transl("啟用 OSC"))
+        self.osc_log_enabled_checkbox.setText(transl("顯示 OSC 日誌"))
+        self.port_label.setText(transl("埠號:"))
+        self.language_label.setText(transl("語言:"))
 
     def _on_settings_changed(self):
         is_enabled = self.osc_enabled_checkbox.isChecked()
@@ -1,30 +1,102 @@
-from ..bootstrap import QProgressBar
 from ..resources import GetProgressColor
+from ..bootstrap import (
+    Qt,
+    QPen,
+    QSize,
+    QFont,
+    QEvent,
+    QBrush,
+    QColor,
+    QRectF,
+    QWidget,
+    QPainter,
+    QEasingCurve,
+    QVariantAnimation,
+    PROGRESS_ANIMATION_DURATION,
+)
 
+# 預先建立每個數值對應的畫刷, 更新數值時不需再查表或建立物件
+_COLOR_BRUSHES = {color: QBrush(QColor(color)) for color in map(GetProgressColor, range(101))}
+PROGRESS_BRUSHES = tuple(_COLOR_BRUSHES[GetProgressColor(value)] for value in range(101))
+BORDER_PEN = QPen(QColor("#3c3c3c"), 2)
+BACKGROUND_BRUSH = QBrush(QColor("#2c2c2c"))
+TEXT_COLOR = QColor("white")
 
-class ProgressBarWidget(QProgressBar):
-    def __init__(self, parent=None):
+
+class ProgressBarWidget(QWidget):
+    """自繪進度條: 數值變更只觸發一次重繪, 不經過樣式表 (可選擇填充動畫)"""
+
+    def __init__(self, parent=None, animation_duration: int = PROGRESS_ANIMATION_DURATION):
         super().__init__(parent)
         self.setMinimumHeight(25)
-        self.setTextVisible(True)
-        self.setRange(0, 100)
-        self._current_color = "#555555"
-        self._apply_style(self._current_color)
+        self._value = 0
+        self._display_value = 0.0  # 目前繪製的數值 (動畫中為過渡值)
+        self._text_font = self._build_text_font()  # 字型變更時才重建, 不在每次重繪時建立
+
+        self.animation = None
+        if animation_duration > 0:
+            self.animation = QVariantAnimation(self)
+            self.animation.setDuration(animation_duration)
+            self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.animation.valueChanged.connect(self._on_animation_step)
+
+    def sizeHint(self) -> QSize:
+        return QSize(250, 25)
+
+    def value(self) -> int:
+        return self._value
 
     def setValue(self, value: int):
-        super().setValue(value)
-        new_color = GetProgressColor(value)
-        if new_color != self._current_color:
-            self._current_color = new_color
-            self._apply_style(new_color)
-
-    def _apply_style(self, color: str):
-        self.setStyleSheet(
-            f"""
-            QProgressBar {{
-                border: 2px solid #3c3c3c; border-radius: 8px; background-color: #2c2c2c;
-                text-align: center; font-weight: bold; font-size: 12px; color: white;
-            }}
-            QProgressBar::chunk {{ background-color: {color}; border-radius: 6px; margin: 1px; }}
-        """
-        )
+        value = max(0, min(100, value))
+        if value == self._value:
+            return
+        self._value = value
+
+        if self.animation is not None and self.isVisible():
+            self.animation.stop()
+            self.animation.setStartValue(self._display_value)
+            self.animation.setEndValue(float(value))
+            self.animation.start()
+        else:
+            self._display_value = float(value)
+            self.update()
+
+    def _build_text_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setBold(True)
+        font.setPixelSize(12)
+        return font
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._text_font = self._build_text_font()
+        super().changeEvent(event)
+
+    def _on_animation_step(self, value: float):
+        self._display_value = value
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 外框與底色
+        frame = QRectF(self.rect()).adjusted(1, 1, -1, -1)
+        painter.setPen(BORDER_PEN)
+        painter.setBrush(BACKGROUND_BRUSH)
+        painter.drawRoundedRect(frame, 8, 8)
+
+        # 填充區塊 (顏色依目前繪製的數值)
+        display_value = self._display_value
+        if display_value > 0:
+            chunk = frame.adjusted(2, 2, -2, -2)
+            chunk.setWidth(chunk.width() * display_value / 100)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(PROGRESS_BRUSHES[round(display_value)])
+            painter.drawRoundedRect(chunk, 6, 6)
+
+        # 置中百分比文字
+        painter.setFont(self._text_font)
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, f"{self._value}%")
+        painter.end()
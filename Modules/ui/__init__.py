@@ -2,3 +2,4 @@ from .GameStatus import GameStatusWidget
 from .GeneratorStatus import GeneratorStatusWidget
 from .LogDisplay import LogDisplayWidget
 from .OscSettings import OscSettingsWidget
+from .MetricsPanel import MetricsPanelWidget
@@ -1 +1,3 @@
-from .log_regex import LOG_PATTERNS
+from .log_event import EventKind, LogEvent
+from .log_regex import LOG_PATTERNS, TIMESTAMP_PATTERN, match_log_line, match_log_content
+from .lazy_mapping import LazyMapping
@@ -0,0 +1,44 @@
+from ..bootstrap import Any, Mapping
+
+
+class LazyMapping(Mapping):
+    """
+    第一次存取時才建立內容的唯讀對照表, 避免匯入時就執行翻譯等初始化
+    建立結果依快取鍵 (例如語言) 保存, 切換回已建立過的鍵時直接沿用
+    切換語言在 GUI 執行緒, 讀取在工作執行緒: (鍵, 內容) 以單一 tuple 整體替換, 不就地修改
+    """
+
+    __slots__ = ("factory", "state", "cache")
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.state: tuple[Any, dict] = (None, None)  # (快取鍵, 內容), 內容為 None 表示尚未建立
+        self.cache: dict[Any, dict] = {}
+
+    def _load(self) -> dict:
+        state = self.state
+        key, data = state
+        if data is None:
+            data = self.cache[key] = self.factory()
+            if self.state is state:  # 建立期間未被切換才替換
+                self.state = (key, data)
+        return data
+
+    def reset(self, key=None):
+        """切換快取鍵, 該鍵尚未建立時於下次存取才建立"""
+        self.state = (key, self.cache.get(key))
+
+    def __getitem__(self, key) -> Any:
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, key) -> bool:
+        return key in self._load()
+
+    def get(self, key, default=None) -> Any:
+        return self._load().get(key, default)
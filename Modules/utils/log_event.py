@@ -0,0 +1,66 @@
+from ..bootstrap import IntEnum
+
+
+class EventKind(IntEnum):
+    """日誌事件類型"""
+
+    MAP = 0
+    SLASHER = 1
+    ITEMS = 2
+    GENERATOR = 3
+    INIT = 4
+    RESET = 5
+
+
+class LogEvent:
+    """
+    解析後的精簡事件記錄, 不保留原始行
+    timestamp: 整數時間戳 (YYYYMMDDhhmmss), 可直接比較先後
+    index: 發電機編號 (僅 GENERATOR)
+    field: 發電機變數名稱, 例如 REMAINING / HAS_BATTERY (僅 GENERATOR)
+    value: 地圖 (str) / 殺手 ID (int) / 物品 (str) / 發電機新值 (int / bool / str)
+    """
+
+    __slots__ = ("kind", "timestamp", "index", "field", "value")
+
+    def __init__(
+        self, kind: EventKind, timestamp: int, value=None, index: int = 0, field: str = ""
+    ):
+        self.kind = kind
+        self.timestamp = timestamp
+        self.index = index
+        self.field = field
+        self.value = value
+
+    @property
+    def cache_key(self):
+        """同一鍵只需保留最新一筆; 發電機依編號與變數分開"""
+        if self.kind is EventKind.GENERATOR:
+            return (self.index, self.field)
+        return self.kind
+
+    def __repr__(self) -> str:
+        return (
+            f"LogEvent({self.kind.name}, {self.timestamp}, value={self.value!r},"
+            f" index={self.index}, field={self.field!r})"
+        )
+
+
+def parse_timestamp(
+    year: bytes, month: bytes, day: bytes, hour: bytes, minute: bytes, second: bytes
+) -> int:
+    """日誌時間戳 (正則擷取的位元組) 轉為可比較的整數"""
+    return int(year + month + day + hour + minute + second)
+
+
+def parse_value(text: str):
+    """發電機變數值轉為對應型別: True / False -> bool, 數字 -> int, 其餘保留字串"""
+    lowered = text.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    try:
+        return int(text)
+    except ValueError:
+        return text
@@ -1,26 +1,83 @@
 from ..bootstrap import re
+from .log_event import EventKind, LogEvent, parse_timestamp, parse_value
 
+# 以位元組比對, 只有擷取到的欄位才解碼為文字 (其餘絕大多數的日誌內容不需解碼)
+# 時間戳每行只解析一次 (取行內第一個, 且必須出現在關鍵字之前)
+TIMESTAMP_PATTERN = re.compile(rb"(\d{4})\.(\d{2})\.(\d{2}) (\d{2}):(\d{2}):(\d{2})")
+
+# (關鍵字, 正則, 類型): 行內包含關鍵字時, 才從關鍵字位置開始執行對應的正則
 LOG_PATTERNS = (
-    (re.compile(r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?Played Map:\s*([^,]+)"), "map"),
-    (re.compile(r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?Slasher:\s*(\d+)"), "slasher"),
-    (
-        re.compile(
-            r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?Selected Items:\s*(.+?)(?=,\s*\w+:|$)"
-        ),
-        "items",
-    ),
+    (b"Played Map:", re.compile(rb"Played Map:\s*([^,]+)"), EventKind.MAP),
+    (b"Slasher:", re.compile(rb"Slasher:\s*(\d+)"), EventKind.SLASHER),
+    (b"Selected Items:", re.compile(rb"Selected Items:\s*(.+?)(?=,\s*\w+:|$)"), EventKind.ITEMS),
     (
+        b"SC_generator",
         re.compile(
-            r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?SC_(generator\d+) Progress check\. Last (\w+) value: (.*?), updated (\w+) value: (.*)"
+            rb"SC_generator(\d+) Progress check\. Last (\w+) value: .*?, updated \w+ value: (.*)"
         ),
-        "generator",
-    ),
-    (
-        re.compile(r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?Generators reset\."),
-        "init",
-    ),
-    (
-        re.compile(r"(\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}).*?Generators reset again\."),
-        "reset",
+        EventKind.GENERATOR,
     ),
+    (b"Generators reset.", re.compile(rb"Generators reset\."), EventKind.INIT),
+    (b"Generators reset again.", re.compile(rb"Generators reset again\."), EventKind.RESET),
 )
+
+
+def _to_event(kind: EventKind, timestamp: int, match: re.Match) -> LogEvent:
+    """只取出需要的欄位並轉為對應型別 (數字直接由位元組轉換, 文字欄位才解碼)"""
+    if kind is EventKind.GENERATOR:
+        index, field, value = match.groups()
+        value = parse_value(value.decode("utf-8", errors="ignore"))
+        return LogEvent(kind, timestamp, value, int(index), field.decode("ascii"))
+    if kind is EventKind.SLASHER:
+        return LogEvent(kind, timestamp, int(match.group(1)))
+    if kind is EventKind.MAP or kind is EventKind.ITEMS:
+        return LogEvent(kind, timestamp, match.group(1).strip().decode("utf-8", errors="ignore"))
+    return LogEvent(kind, timestamp)
+
+
+def match_log_line(line: bytes) -> list[LogEvent]:
+    """單次分派: 先以位元組關鍵字過濾, 只執行命中的正則, 回傳解析後的事件"""
+    results = []
+    timestamp = None
+
+    for marker, pattern, kind in LOG_PATTERNS:
+        index = line.find(marker)
+        if index < 0:
+            continue
+
+        if timestamp is None:
+            line = line.rstrip()  # 只去除行尾, 不影響已找到的位置
+            timestamp = TIMESTAMP_PATTERN.search(line)
+            if not timestamp:
+                break
+            timestamp_end = timestamp.end()
+            timestamp_value = parse_timestamp(*timestamp.groups())
+
+        # 關鍵字必須出現在時間戳之後
+        match = pattern.search(line, max(index, timestamp_end))
+        if match:
+            results.append(_to_event(kind, timestamp_value, match))
+
+    return results
+
+
+def match_log_content(content: bytes) -> list[LogEvent]:
+    """
+    多行內容的解析: 以位元組位移在整段內容中搜尋關鍵字, 只切出命中的行逐行比對
+    不相關的行不會被切分, 也不會進入 Python 迴圈; 回傳的事件依行的先後排列
+    """
+    starts = set()
+    for marker, _pattern, _kind in LOG_PATTERNS:
+        index = content.find(marker)
+        while index >= 0:
+            starts.add(content.rfind(b"\n", 0, index) + 1)
+            end = content.find(b"\n", index)
+            if end < 0:
+                break
+            index = content.find(marker, end)  # 同一行只需記錄一次
+
+    results = []
+    for start in sorted(starts):
+        end = content.find(b"\n", start)
+        results += match_log_line(content[start:end] if end >= 0 else content[start:])
+    return results
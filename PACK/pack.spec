@@ -30,7 +30,7 @@ excludes = [
 
     # 網絡與 Web 服務
     'email', 'ftplib', 'telnetlib', 'nntplib',
-    'poplib', 'smtpd', 'smtplib', 'mailbox', 'asyncio',
+    'poplib', 'smtpd', 'smtplib', 'mailbox',  # asyncio 用於無介面模式的疊加層伺服器
     'ssl', '_ssl', 'http', 'urllib.request', 'gopherlib',
     'imaplib', 'wsgiref', 'webbrowser', 'cgi', 'cgitb',
     'xmlrpc'
@@ -40,8 +40,8 @@ excludes = [
     'requests', 'flask', 'jinja2', 'werkzeug', 'sqlalchemy',
     'PIL', 'Pillow', 'pygame',
 
-    # 數據庫
-    'sqlite3', 'dbm', 'gdbm', 'dbm.gnu', 'dbm.ndbm', 'dbm.dumb',
+    # 數據庫 (sqlite3 用於對局歷史紀錄)
+    'dbm', 'gdbm', 'dbm.gnu', 'dbm.ndbm', 'dbm.dumb',
 
     # 數據解析
     # 排除除 JSON 和基本配置外的所有數據格式處理器
@@ -104,8 +104,13 @@ a = Analysis(
     ['../SlashcoSense.pyw'],
     pathex=[],
     binaries=[],
-    datas=[('../IMG/SlashCo.ico', '.')],
-    hiddenimports=[],
+    datas=[('../IMG/SlashCo.ico', '.'), ('../IMG/*.webp', 'IMG'), ('../IMG/SlashCo.ico', 'IMG')],
+    # 延遲匯入 (模組層級 __getattr__) 的模組, 靜態分析無法發現
+    hiddenimports=[
+        'PySide6.QtWidgets', 'PySide6.QtGui', 'Modules.ui',
+        'Modules.core.IconRenderer', 'Modules.core.MetricsServer',
+        'Modules.core.OverlayServer', 'Modules.core.HeadlessDaemon',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -2,50 +2,199 @@
 
 from Modules import (
     sys,
+    time,
+    signal,
     Path,
+    argparse,
     Optional,
     Any,
-    udp_client,
-    SimpleUDPClient,
-    QApplication,
-    QMainWindow,
-    QWidget,
-    QVBoxLayout,
-    QUrl,
+    QCoreApplication,
     QSize,
     QTimer,
     QThread,
-    QNetworkRequest,
+    Signal,
     # 以下為 自訂模塊數據
     transl,
-    setLang,
+    set_language,
     parse_items,
+    SLASHERS,
     LogProcessor,
+    LogTailer,
+    OscSender,
+    HeadlessDaemon,
+    SessionHistory,
+    Metrics,
+    osc_parameters,
+    VRC_LOG_DIR,
+    OVERLAY_PORT,
+    HISTORY_DB_PATH,
+    LOG_CHECKPOINT_PATH,
+    HEADLESS_CHECKPOINT_PATH,
+    WINDOWS_ICON_URL,
+    UDP_CLIENT_AVAILABLE,
+)
+
+
+def default_log_dir(log_dir: Optional[Path] = None) -> Path:
+    """指定的目錄或 VRChat 日誌目錄, 不存在時 (例如非 Windows 開發環境) 使用程式旁的 TEST 目錄"""
+    if log_dir:
+        return log_dir
+    if VRC_LOG_DIR.exists():
+        return VRC_LOG_DIR
+    return Path(sys.executable if getattr(sys, "frozen", False) else __file__).parent / "TEST"
+
+
+def state_paths(log_dir: Optional[Path] = None) -> tuple[Path, Path]:
+    """
+    對局歷史資料庫與檢查點的路徑
+    指定日誌目錄 (重播或壓力測試) 時放在該目錄的 .slashcosense 內, 不寫入玩家的歷史紀錄與檢查點
+    """
+    if not log_dir:
+        return HISTORY_DB_PATH, LOG_CHECKPOINT_PATH
+
+    state_dir = (log_dir.parent if log_dir.suffix == ".txt" else log_dir) / ".slashcosense"
+    return state_dir / HISTORY_DB_PATH.name, state_dir / LOG_CHECKPOINT_PATH.name
+
+
+def parse_args(argv: list[str]):
+    """程式參數, 其餘參數交給 Qt 處理"""
+    parser = argparse.ArgumentParser(description="SlashcoSense")
+    parser.add_argument("--log-dir", type=Path, help="monitor this directory instead of VRChat's")
+    parser.add_argument("--debug", action="store_true", help="show the performance metrics panel")
+    parser.add_argument(
+        "--metrics-port", type=int, default=0, help="serve Prometheus metrics on 127.0.0.1:PORT"
+    )
+    parser.add_argument(
+        "--instance",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("LOG_PATH", "OSC_PORT"),
+        help="also monitor another VRChat client (log directory or output_log file)",
+    )
+    parser.add_argument(
+        "--headless", action="store_true", help="run without a window and serve an overlay feed"
+    )
+    parser.add_argument(
+        "--overlay-port", type=int, default=OVERLAY_PORT, help="headless WebSocket / HTTP port"
+    )
+    parser.add_argument("--osc-port", type=int, default=0, help="headless: also send OSC to PORT")
+    args, qt_args = parser.parse_known_args(argv)
+
+    instances = []
+    for path, port in args.instance:
+        if not port.isdigit() or not 1 <= int(port) <= 65535:
+            parser.error(f"invalid OSC_PORT for {path}: {port}")
+        instances.append((Path(path), int(port)))
+
+    args.instance = instances
+
+    # 無介面模式只監控單一實例, 不建立偵錯面板與指標端點
+    if args.headless:
+        unsupported = [
+            flag
+            for flag, value in (
+                ("--instance", args.instance),
+                ("--debug", args.debug),
+                ("--metrics-port", args.metrics_port),
+            )
+            if value
+        ]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be used with --headless")
+
+    return args, qt_args
+
+
+def run_headless(args, qt_args: list[str]) -> int:
+    """無介面模式: 只建立 QCoreApplication, 不載入任何視窗元件"""
+    app = QCoreApplication(sys.argv[:1] + qt_args)
+
+    try:
+        daemon = HeadlessDaemon(
+            default_log_dir(args.log_dir),
+            args.overlay_port,
+            args.osc_port,
+            # 使用自己的檢查點, 可與視窗版同時執行
+            checkpoint_path=state_paths(args.log_dir)[1].with_name(HEADLESS_CHECKPOINT_PATH.name),
+        )
+    except Exception as e:
+        print(f"Error in HeadlessDaemon: {e}", file=sys.stderr)
+        return 1
+
+    # Qt 事件循環中 Python 的信號處理只會在執行 Python 程式碼時觸發, 以計時器定期讓出
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    wakeup = QTimer()
+    wakeup.timeout.connect(lambda: None)
+    wakeup.start(500)
+
+    app.aboutToQuit.connect(daemon.close)
+    QTimer.singleShot(0, daemon.start)
+    return app.exec()
+
+
+# 無介面模式在匯入任何視窗元件 (QtWidgets / QtGui) 之前啟動並結束
+if __name__ == "__main__":
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.headless:
+        sys.exit(run_headless(args, qt_args))
+
+from Modules import (
+    QApplication,
+    QMainWindow,
+    QWidget,
+    QVBoxLayout,
+    MetricsServer,
     GameStatusWidget,
     LogDisplayWidget,
     OscSettingsWidget,
     GeneratorStatusWidget,
-    VRC_LOG_DIR,
-    WINDOWS_ICON_URL,
-    UDP_CLIENT_AVAILABLE,
+    MetricsPanelWidget,
 )
 
 
 class SlashcoSenseMainWindow(QMainWindow):
     """主視窗類 - 負責協調 UI 組件和後端邏輯"""
 
-    def __init__(self):
+    language_changed = Signal()
+    osc_result = Signal(dict, str)  # OscSender 工作執行緒回報的送出結果, 以佇列連線回到 GUI 執行緒
+    instance_osc_result = Signal(int, dict, str)  # 其他實例的送出結果 (實例索引, 參數, 錯誤訊息)
+
+    def __init__(
+        self,
+        debug: bool = False,
+        metrics_port: int = 0,
+        instances: Optional[list[tuple[Path, int]]] = None,
+        log_dir: Optional[Path] = None,
+    ):
         super().__init__()
 
         self.osc_enabled = False
-        self.osc_client: Optional[SimpleUDPClient] = None
+        self.osc_sender: Optional[OscSender] = None
+        self.osc_result.connect(self._on_osc_result)
+        self.instance_osc_result.connect(self._on_instance_osc_result)
         self.session_key = ""
 
-        self._setup_ui()
+        # 其他 VRChat 實例 (日誌目錄或日誌檔, OSC 埠號), 介面只顯示主要實例
+        self.instances = instances or []
+        self.instance_senders: list[Optional[OscSender]] = [None] * len(self.instances)
+        self.log_dir = default_log_dir(log_dir)
+        self.history_path, self.checkpoint_path = state_paths(log_dir)
+
+        # 效能指標: 偵錯面板或指標端點啟用時才收集
+        self.metrics = Metrics() if debug or metrics_port else None
+        self.metrics_server: Optional[MetricsServer] = None
+        self.metrics_panel: Optional[MetricsPanelWidget] = None
+        if self.metrics:
+            self.metrics.add_collector(self._collect_metrics)
+
+        self._setup_ui(debug)
         self._apply_dark_theme()
         self._setup_logic_thread()
+        self._setup_metrics_server(metrics_port)
 
-    def _setup_ui(self):
+    def _setup_ui(self, debug: bool = False):
         """設定使用者介面 - 建立並組合UI組件"""
         self.setWindowTitle("SlashCoSense")
         self.setMinimumSize(QSize(500, 700))
@@ -69,43 +218,106 @@ class SlashcoSenseMainWindow(QMainWindow):
         main_layout.addWidget(self.osc_settings_widget)
         main_layout.addWidget(self.log_display_widget)
 
+        if debug:
+            self.metrics_panel = MetricsPanelWidget(self.metrics)
+            main_layout.addWidget(self.metrics_panel)
+
         # 連接UI組件的信號
         self.osc_settings_widget.settings_changed.connect(self._toggle_osc)
+        self.osc_settings_widget.language_changed.connect(self._change_language)
         self.game_status_widget.window_icon_ready.connect(self.setWindowIcon)
 
     def _setup_logic_thread(self):
         """設定並啟動後端邏輯處理執行緒"""
-        log_dir = VRC_LOG_DIR
-        if not log_dir.exists():
-            log_dir = (
-                Path(sys.executable if getattr(sys, "frozen", False) else __file__).parent / "TEST"
-            )
+        log_dir = self.log_dir
+
+        # 對局歷史紀錄, 資料庫無法開啟時仍可正常監控
+        try:
+            self.session_history = SessionHistory(self.history_path)
+        except Exception as e:
+            self.session_history = None
+            self.log_display_widget.append_message(f"Error in SessionHistory: {e}")
 
         self.logic_thread = QThread()
-        self.log_processor = LogProcessor(log_dir)
-        self.log_processor.moveToThread(self.logic_thread)
+        self.log_processor = LogProcessor(
+            log_dir,
+            batch_signals=True,
+            history=self.session_history,
+            checkpoint_path=self.checkpoint_path,
+            metrics=self.metrics,
+        )
 
-        # 連接後端處理器的信號到主視窗的槽
-        self.logic_thread.started.connect(self.log_processor.run)
-        self.log_processor.log_message_generated.connect(self.log_display_widget.append_message)
-        self.log_processor.game_info_updated.connect(self._on_game_info_updated)
-        self.log_processor.session_info_updated.connect(self._on_session_info_updated)
-        self.log_processor.generator_updated.connect(self._on_generator_updated)
-        self.log_processor.generators_reset.connect(self._on_generators_reset)
+        # 每個實例有各自的對局狀態與檢查點, 但共用同一個執行緒與檔案監控
+        self.instance_processors = [
+            LogProcessor(
+                path,
+                batch_signals=True,
+                history=self.session_history,
+                checkpoint_path=self.checkpoint_path.with_name(f"checkpoint_{index}.json"),
+                metrics=self.metrics,
+            )
+            for index, (path, _port) in enumerate(self.instances, 1)
+        ]
+        self.log_tailer = LogTailer([self.log_processor, *self.instance_processors])
+        self.log_tailer.moveToThread(self.logic_thread)
+
+        # 後端處理器每個週期只送出一次批次事件, 由主視窗依序分派
+        self._event_handlers = {
+            "log_message_generated": self.log_display_widget.append_message,
+            "game_info_updated": self._on_game_info_updated,
+            "session_info_updated": self._on_session_info_updated,
+            "generator_updated": self._on_generator_updated,
+            "generators_reset": self._on_generators_reset,
+        }
+        self.logic_thread.started.connect(self.log_tailer.run)
+        self.log_processor.events_batched.connect(self._on_events_batched)
+        for processor in self.instance_processors:
+            processor.events_batched.connect(self._on_instance_events_batched)
+        # 跨執行緒, 在處理器執行緒重新翻譯
+        self.language_changed.connect(self.log_processor.retranslate)
 
         # 統一延遲啟動 IO 密集型任務
         QTimer.singleShot(300, self._start_tasks)
 
+    def _setup_metrics_server(self, port: int):
+        """本機 Prometheus 指標端點 (127.0.0.1)"""
+        if not port:
+            return
+
+        try:
+            self.metrics_server = MetricsServer(self.metrics, port)
+            self.log_display_widget.append_message(
+                f"Metrics: http://127.0.0.1:{self.metrics_server.port}/metrics"
+            )
+        except Exception as e:
+            self.log_display_widget.append_message(f"Error in MetricsServer: {e}")
+
+    def _collect_metrics(self) -> dict:
+        """讀取指標時才取得 OSC 與歷史紀錄的計數"""
+        values = {}
+        if self.osc_sender:
+            values[("osc_packets_sent", "")] = self.osc_sender.sent_packets
+            values[("osc_packets_failed", "")] = self.osc_sender.failed_packets
+        if self.session_history:
+            values[("history_batches_written", "")] = self.session_history.written_batches
+            values[("history_batches_failed", "")] = self.session_history.failed_batches
+        return values
+
     def _start_tasks(self):
         """啟動日誌監控和圖示載入"""
 
         # 1. 啟動日誌監控執行緒
         self.logic_thread.start()
 
-        # 2. 請求視窗圖示 (由 GameStatusWidget 的 network_manager 處理)
-        request = QNetworkRequest(QUrl(WINDOWS_ICON_URL))
-        request.setAttribute(QNetworkRequest.Attribute.User, WINDOWS_ICON_URL)
-        self.game_status_widget.network_manager.get(request)
+        # 2. 載入視窗圖示 (由 GameStatusWidget 的 image_cache 處理)
+        self.game_status_widget.load_window_icon(WINDOWS_ICON_URL)
+
+        # 3. 背景並行預取所有殺手圖片, 更新磁碟快取
+        slasher_icons = [info["icon"] for info in SLASHERS.values()]
+        self.game_status_widget.image_cache.prefetch([WINDOWS_ICON_URL] + slasher_icons)
+
+        # 4. 背景預先渲染本機已有的殺手圖片, 對局開始時不需再解碼縮放
+        self.game_status_widget.prerender(slasher_icons)
 
     def _apply_dark_theme(self):
         """應用暗黑主題"""
@@ -128,12 +340,12 @@ class SlashcoSenseMainWindow(QMainWindow):
             QCheckBox::indicator:checked {
                 border: 2px solid #27ae60; background-color: #27ae60; border-radius: 3px;
             }
-            QLineEdit {
+            QLineEdit, QComboBox {
                 background-color: #404040; border: 2px solid #555555; border-radius: 4px;
                 padding: 5px; color: #ffffff;
             }
             QLineEdit:focus { border-color: #3498db; }
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e; border: 2px solid #3c3c3c; border-radius: 8px;
                 color: #ffffff; selection-background-color: #3498db;
             }
@@ -145,6 +357,54 @@ class SlashcoSenseMainWindow(QMainWindow):
         """
         )
 
+    def _change_language(self, lang: str):
+        """執行中切換語言: 替換查詢表後重設介面文字, 對局資訊由處理器以原始值重新發送"""
+        set_language(lang)
+
+        for widget in (
+            self.game_status_widget,
+            self.generator_status_widget,
+            self.osc_settings_widget,
+            self.log_display_widget,
+            self.metrics_panel,
+        ):
+            if widget:
+                widget.retranslate_ui()
+
+        self.language_changed.emit()
+
+    def _on_events_batched(self, events: list, emitted_at: float):
+        """一次套用一個處理週期內的所有事件"""
+        if self.metrics:
+            self.metrics.observe("signal_latency_seconds", time.perf_counter() - emitted_at)
+
+        handlers = self._event_handlers
+        for name, args in events:
+            handlers[name](*args)
+
+        # 本週期產生的 OSC 參數合併為一個封包送出
+        if self.osc_sender:
+            self.osc_sender.flush()
+
+    def _on_instance_events_batched(self, events: list, emitted_at: float):
+        """其他實例的事件只寫入日誌面板, 並送到該實例自己的 OSC 埠號"""
+        if self.metrics:
+            self.metrics.observe("signal_latency_seconds", time.perf_counter() - emitted_at)
+
+        index = self.instance_processors.index(self.sender())
+        label = self.instances[index][0].name
+        sender = self.instance_senders[index] if self.osc_enabled else None
+
+        for name, args in events:
+            if name == "log_message_generated":
+                self.log_display_widget.append_message(f"[{label}] {args[0]}")
+            elif sender:
+                for param, value in osc_parameters(name, args):
+                    sender.send(param, value)
+
+        if sender:
+            sender.flush()
+
     def _on_game_info_updated(
         self, map_name: str, slasher_name: str, slasher_icon: str, slasher_id: int
     ):
@@ -152,10 +412,9 @@ class SlashcoSenseMainWindow(QMainWindow):
 
         self.game_status_widget.set_image_url(slasher_icon if slasher_icon else "")
 
-        if self._send_osc("SlasherID", slasher_id) and self.osc_settings_widget.is_log_enabled():
-            self.log_display_widget.append_message(
-                f"{transl('[OSC] 傳送 SlasherID')}: {slasher_id}"
-            )
+        self._send_osc_parameters(
+            "game_info_updated", (map_name, slasher_name, slasher_icon, slasher_id)
+        )
 
     def _on_session_info_updated(self, session_key: str):
         """當遊戲局內資訊更新時記錄日誌"""
@@ -170,77 +429,122 @@ class SlashcoSenseMainWindow(QMainWindow):
 
             self.log_display_widget.append_message(session_key)
 
-    def _on_generator_updated(self, gen_name: str, var_type: str, new_value: str):
+    def _on_generator_updated(self, gen_index: int, var_type: str, new_value: Any):
         """更新發電機UI"""
-        self.generator_status_widget.update_generator(gen_name, var_type, new_value)
-
-        # OSC 發送邏輯
-        if var_type == "REMAINING":
-            filled = 4 - int(new_value)
-            param = f"GENERATOR{gen_name[-1]}_FUEL"
-            if self._send_osc(param, filled) and self.osc_settings_widget.is_log_enabled():
-                self.log_display_widget.append_message(f"{transl('[OSC] 傳送 ' + param)}: {filled}")
-        elif var_type == "HAS_BATTERY":
-            battery_value = 1 if new_value.lower() == "true" else 0
-            param = f"GENERATOR{gen_name[-1]}_BATTERY"
-            if self._send_osc(param, battery_value) and self.osc_settings_widget.is_log_enabled():
-                self.log_display_widget.append_message(
-                    f"{transl('[OSC] 傳送 ' + param)}: {battery_value}"
-                )
+        self.generator_status_widget.update_generator(gen_index, var_type, new_value)
+
+        self._send_osc_parameters("generator_updated", (gen_index, var_type, new_value))
 
     def _on_generators_reset(self):
         """重置發電機UI"""
         self.generator_status_widget.reset_generators()
 
         if self.osc_enabled:
-            self._send_osc("GENERATOR1_FUEL", 0)
-            self._send_osc("GENERATOR1_BATTERY", 0)
-            self._send_osc("GENERATOR2_FUEL", 0)
-            self._send_osc("GENERATOR2_BATTERY", 0)
+            for param, value in osc_parameters("generators_reset", ()):
+                self._send_osc(param, value)
 
     def _toggle_osc(self, enabled: bool, port: int):
         """切換 OSC 狀態"""
+        self._close_osc()
+
         if enabled:
             if 1 <= port <= 65535 and UDP_CLIENT_AVAILABLE:
                 try:
-                    self.osc_client = udp_client.SimpleUDPClient("127.0.0.1", port)
+                    self.osc_sender = OscSender("127.0.0.1", port, self.osc_result.emit)
                     self.osc_enabled = True
                     self.log_display_widget.append_message(
                         f"{transl('OSC 已啟用')}（{transl('埠')}：{port}）"
                     )
+                    self._open_instance_osc()
                     return
                 except Exception as e:
                     self.log_display_widget.append_message(f"{transl('錯誤：OSC 啟用失敗')}: {e}")
             else:
                 self.log_display_widget.append_message(transl("錯誤：埠號無效或 OSC 不可用"))
         else:
-            self.osc_client = None
-            self.osc_enabled = False
             self.log_display_widget.append_message(transl("OSC 已停用"))
 
         # 如果啟用失敗或要禁用，則更新UI checkbox
         self.osc_settings_widget.set_enabled(False)
 
-    def _send_osc(self, param: str, value: Any) -> bool:
-        """快速傳送OSC引數"""
-        if self.osc_enabled and self.osc_client:
+    def _open_instance_osc(self):
+        """其他實例各自使用啟動參數指定的埠號"""
+        for index, (path, port) in enumerate(self.instances):
             try:
-                self.osc_client.send_message(f"/avatar/parameters/{param}", value)
-                return True
-            except Exception:
-                return False
-        return False
+                self.instance_senders[index] = OscSender(
+                    "127.0.0.1",
+                    port,
+                    lambda params, error, index=index: self.instance_osc_result.emit(
+                        index, params, error
+                    ),
+                )
+                self.log_display_widget.append_message(
+                    f"[{path.name}] {transl('OSC 已啟用')}（{transl('埠')}：{port}）"
+                )
+            except Exception as e:
+                self.log_display_widget.append_message(
+                    f"[{path.name}] {transl('錯誤：OSC 啟用失敗')}: {e}"
+                )
+
+    def _close_osc(self):
+        self.osc_enabled = False
+        if self.osc_sender:
+            self.osc_sender.close()
+            self.osc_sender = None
+
+        for index, sender in enumerate(self.instance_senders):
+            if sender:
+                sender.close()
+                self.instance_senders[index] = None
+
+    def _send_osc_parameters(self, name: str, args: tuple):
+        """主要實例的事件轉為 OSC 參數送出 (實際送出後才由 _on_osc_result 寫入日誌)"""
+        for param, value in osc_parameters(name, args):
+            self._send_osc(param, value)
+
+    def _send_osc(self, param: str, value: Any):
+        """暫存OSC引數, 於本週期結束時由 OscSender 在背景送出"""
+        if self.osc_enabled and self.osc_sender:
+            self.osc_sender.send(param, value)
+
+    def _on_osc_result(self, params: dict, error: str):
+        """OscSender 送出後回報的結果: 失敗一律顯示, 成功時依設定寫入日誌"""
+        if error:
+            self.log_display_widget.append_message(f"{transl('錯誤：OSC 傳送失敗')}: {error}")
+        elif self.osc_settings_widget.is_log_enabled():
+            for address, value in params.items():
+                param = address.rsplit("/", 1)[-1]
+                self.log_display_widget.append_message(f"{transl('[OSC] 傳送 ' + param)}: {value}")
+
+    def _on_instance_osc_result(self, index: int, params: dict, error: str):
+        """其他實例只顯示送出失敗, 與主要實例相同以佇列連線回到 GUI 執行緒"""
+        if error:
+            label = self.instances[index][0].name
+            self.log_display_widget.append_message(
+                f"[{label}] {transl('錯誤：OSC 傳送失敗')}: {error}"
+            )
 
     def closeEvent(self, event):
-        """關閉視窗時，確保後台執行緒也停止"""
-        self.log_processor.stop()
+        """關閉視窗時，確保後台執行緒也停止 (執行緒結束時會保存檢查點)"""
+        self.log_tailer.stop()
         self.logic_thread.quit()
         self.logic_thread.wait()
+        self._close_osc()
+        if self.metrics_server:
+            self.metrics_server.close()
+        if self.session_history:
+            self.session_history.close()
+        self.game_status_widget.icon_renderer.close()
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = SlashcoSenseMainWindow()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = SlashcoSenseMainWindow(
+        debug=args.debug,
+        metrics_port=args.metrics_port,
+        instances=args.instance,
+        log_dir=args.log_dir,
+    )
     window.show()
     sys.exit(app.exec())
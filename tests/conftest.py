@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 直接執行 pytest 時也能匯入專案根目錄的 Modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
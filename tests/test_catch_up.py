@@ -0,0 +1,62 @@
+import pytest
+
+from Modules.core import LogProcessor
+from Modules.core.CatchUp import find_round_start
+
+PREVIOUS_ROUND = [
+    b"2024.05.01 20:00:00 Log        -  Generators reset.",
+    b"2024.05.01 20:00:00 Log        -  Played Map: Dorm, Slasher: 1, Selected Items: Cookie,"
+    b" Difficulty: 2",
+    b"2024.05.01 20:00:05 Log        -  SC_generator1 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: 3",
+    b"2024.05.01 20:05:00 Log        -  [Behaviour] OnPlayerLeft Mika",
+]
+INIT = b"2024.05.01 21:00:00 Log        -  Generators reset."
+INFO = (
+    b"2024.05.01 21:00:00 Log        -  Played Map: Erie, Slasher: 3, Selected Items: Beer,"
+    b" Difficulty: 2"
+)
+NOISE = b"2024.05.01 21:00:00 Log        -  [Behaviour] OnPlayerJoined Nyan"
+GENERATOR = (
+    b"2024.05.01 21:00:04 Log        -  SC_generator2 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: 2"
+)
+
+
+def write_log(tmp_path, lines, newline=b"\n"):
+    path = tmp_path / "output_log_2024-05-01_20-00-00.txt"
+    path.write_bytes(newline.join(lines) + newline)
+    return path
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"])
+@pytest.mark.parametrize(
+    "round_lines",
+    [[INIT, NOISE, INFO, GENERATOR], [INFO, NOISE, INIT, GENERATOR]],
+    ids=["info-after-init", "info-before-init"],
+)
+def test_catch_up_restores_round_info(tmp_path, round_lines, newline):
+    path = write_log(tmp_path, PREVIOUS_ROUND + round_lines, newline)
+
+    processor = LogProcessor(path, batch_signals=True)
+    processor.poll()
+
+    assert processor.game_info == ("Erie", 3, "Beer")
+    assert processor.generator_state == {(2, "REMAINING"): 2}
+
+
+def test_round_start_skips_earlier_lines_of_the_same_second(tmp_path):
+    path = write_log(tmp_path, PREVIOUS_ROUND + [NOISE, INFO, NOISE, INIT, GENERATOR])
+    data = path.read_bytes()
+
+    with open(path, "rb") as handle:
+        assert find_round_start(handle) == data.index(INFO)
+
+
+def test_round_start_ignores_round_info_from_an_earlier_second(tmp_path):
+    earlier_info = INFO.replace(b"21:00:00", b"20:59:59")
+    path = write_log(tmp_path, PREVIOUS_ROUND + [earlier_info, INIT, GENERATOR])
+    data = path.read_bytes()
+
+    with open(path, "rb") as handle:
+        assert find_round_start(handle) == data.index(INIT)
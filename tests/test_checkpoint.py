@@ -0,0 +1,35 @@
+import sys
+
+from Modules.core import LogProcessor
+
+ROUND = [
+    b"2024.05.01 21:00:00 Log        -  Generators reset.",
+    b"2024.05.01 21:00:00 Log        -  Played Map: Erie, Slasher: 3, Selected Items: Beer,"
+    b" Difficulty: 2",
+    b"2024.05.01 21:00:04 Log        -  SC_generator2 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: 2",
+]
+
+
+def test_unchanged_state_is_not_rewritten_after_restore(tmp_path, monkeypatch):
+    log_file = tmp_path / "output_log_2024-05-01_21-00-00.txt"
+    log_file.write_bytes(b"\n".join(ROUND) + b"\n")
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    processor = LogProcessor(log_file, checkpoint_path=checkpoint_path, batch_signals=True)
+    processor.poll()
+    processor.save_checkpoint()
+    processor.close()
+    assert checkpoint_path.exists()
+
+    saved = []
+    module = sys.modules[LogProcessor.__module__]
+    monkeypatch.setattr(module, "save_checkpoint", lambda *args: saved.append(args))
+
+    processor = LogProcessor(log_file, checkpoint_path=checkpoint_path, batch_signals=True)
+    processor.poll()
+    assert processor.game_info == ("Erie", 3, "Beer")
+
+    processor.save_checkpoint()
+    processor.close()
+    assert saved == []
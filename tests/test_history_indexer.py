@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from Modules.tools.HistoryIndexer import pending_files
+
+
+def test_pending_files_skips_files_removed_during_the_scan(tmp_path, monkeypatch):
+    for name, size in (("a", 10), ("b", 30), ("c", 20)):
+        (tmp_path / f"output_log_{name}.txt").write_bytes(b"x" * size)
+
+    stat = Path.stat
+
+    def rotated_stat(self, *args, **kwargs):
+        if self.name == "output_log_b.txt":
+            raise FileNotFoundError(self)
+        return stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", rotated_stat)
+    jobs = pending_files(tmp_path, {})
+
+    assert [(Path(job[0]).name, job[4]) for job in jobs] == [
+        ("output_log_c.txt", 20),
+        ("output_log_a.txt", 10),
+    ]
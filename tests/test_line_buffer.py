@@ -0,0 +1,61 @@
+import sys
+
+import pytest
+
+from Modules.core import LogProcessor
+
+INIT = b"2024.05.01 21:00:00 Log        -  Generators reset.\n"
+INFO = (
+    b"2024.05.01 21:00:00 Log        -  Played Map: Erie, Slasher: 3, Selected Items: Beer,"
+    b" Difficulty: 2\n"
+)
+GENERATOR = (
+    b"2024.05.01 21:00:04 Log        -  SC_generator2 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: 2\n"
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "output_log_2024-05-01_21-00-00.txt"
+    path.write_bytes(INIT)
+    return path
+
+
+def append(path, data: bytes):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+def test_line_written_in_pieces_is_parsed_once_complete(log_file):
+    processor = LogProcessor(log_file, batch_signals=True)
+    processor.poll()
+
+    for start in range(0, len(INFO) - 1, 7):
+        append(log_file, INFO[start : min(start + 7, len(INFO) - 1)])
+        processor.read_new_content()
+    assert processor.game_info is None
+
+    append(log_file, b"\n")
+    processor.read_new_content()
+
+    assert processor.game_info == ("Erie", 3, "Beer")
+    assert processor.line_buffer == []
+    assert processor.file_position == log_file.stat().st_size
+
+
+def test_long_line_is_flushed_past_the_buffer_limit(log_file, monkeypatch):
+    monkeypatch.setattr(sys.modules[LogProcessor.__module__], "LOG_LINE_BUFFER_LIMIT", 64)
+    processor = LogProcessor(log_file, batch_signals=True)
+    processor.poll()
+
+    for _ in range(10):
+        append(log_file, b"x" * 50)
+        processor.read_new_content()
+        assert processor.line_buffer_size <= 64
+
+    append(log_file, b"\n" + GENERATOR)
+    processor.read_new_content()
+
+    assert processor.generator_state == {(2, "REMAINING"): 2}
+    assert processor.file_position == log_file.stat().st_size
@@ -0,0 +1,116 @@
+import pytest
+
+from Modules.utils import EventKind, match_log_line, match_log_content
+
+MAP, SLASHER, ITEMS = EventKind.MAP, EventKind.SLASHER, EventKind.ITEMS
+GENERATOR, INIT, RESET = EventKind.GENERATOR, EventKind.INIT, EventKind.RESET
+
+ROUND = [
+    b"2024.05.01 21:00:00 Log        -  Generators reset.",
+    b"2024.05.01 21:00:00 Log        -  Played Map: Dorm, Slasher: 3, Selected Items: Beer,"
+    b" Difficulty: 2",
+    b"2024.05.01 21:00:01 Log        -  [Behaviour] OnPlayerJoined Mika",
+    b"2024.05.01 21:00:04 Log        -  SC_generator2 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: 2",
+    b"2024.05.01 21:00:05 Log        -  SC_generator1 Progress check."
+    b" Last HAS_BATTERY value: False, updated HAS_BATTERY value: True",
+    b"2024.05.01 21:00:09 Log        -  Generators reset again.",
+]
+NON_ASCII = [
+    "2024.05.01 21:00:00 Log        -  Played Map: 宿舍 Ériè, Slasher: 7, Selected Items: 啤酒,"
+    " Difficulty: 2".encode(),
+    "2024.05.01 21:00:01 Log        -  [Behaviour] OnPlayerJoined ミカ".encode(),
+]
+INVALID_UTF8 = [
+    b"2024.05.01 21:00:00 Log        -  Played Map: Do\xffrm\xc3, Slasher: 1,"
+    b" Selected Items: Be\xe5\x95er, Difficulty: 2",
+    b"2024.05.01 21:00:01 Log        -  \xfe\xfe OnPlayerJoined \x80",
+    b"2024.05.01 21:00:02 Log        -  SC_generator3 Progress check."
+    b" Last REMAINING value: 4, updated REMAINING value: \xff3",
+]
+SEVERAL_MARKERS = [
+    b"2024.05.01 21:00:00 Log        -  Generators reset. Played Map: Erie, Slasher: 2,"
+    b" Selected Items: Cookie, Difficulty: 1",
+    b"2024.05.01 21:00:01 Log        -  Generators reset again. SC_generator4 Progress check."
+    b" Last REMAINING value: 1, updated REMAINING value: 0",
+    b"Played Map: Erie 2024.05.01 21:00:02 Log        -  Slasher: 5",
+]
+
+# 改為位元組比對之前 (先整段解碼, 再以字串正則逐行比對) 的實作對上列內容的輸出
+# (類型, 時間戳, 值, 發電機編號, 變數名稱)
+EXPECTED = {
+    "round": [
+        (INIT, 20240501210000, None, 0, ""),
+        (MAP, 20240501210000, "Dorm", 0, ""),
+        (SLASHER, 20240501210000, 3, 0, ""),
+        (ITEMS, 20240501210000, "Beer", 0, ""),
+        (GENERATOR, 20240501210004, 2, 2, "REMAINING"),
+        (GENERATOR, 20240501210005, True, 1, "HAS_BATTERY"),
+        (RESET, 20240501210009, None, 0, ""),
+    ],
+    "non-ascii": [
+        (MAP, 20240501210000, "宿舍 Ériè", 0, ""),
+        (SLASHER, 20240501210000, 7, 0, ""),
+        (ITEMS, 20240501210000, "啤酒", 0, ""),
+    ],
+    "invalid-utf8": [
+        (MAP, 20240501210000, "Dorm", 0, ""),
+        (SLASHER, 20240501210000, 1, 0, ""),
+        (ITEMS, 20240501210000, "Beer", 0, ""),
+        (GENERATOR, 20240501210002, 3, 3, "REMAINING"),
+    ],
+    "several-markers": [
+        (MAP, 20240501210000, "Erie", 0, ""),
+        (SLASHER, 20240501210000, 2, 0, ""),
+        (ITEMS, 20240501210000, "Cookie", 0, ""),
+        (INIT, 20240501210000, None, 0, ""),
+        (GENERATOR, 20240501210001, 0, 4, "REMAINING"),
+        (RESET, 20240501210001, None, 0, ""),
+        (SLASHER, 20240501210002, 5, 0, ""),
+    ],
+}
+FIXTURES = {
+    "round": ROUND,
+    "non-ascii": NON_ASCII,
+    "invalid-utf8": INVALID_UTF8,
+    "several-markers": SEVERAL_MARKERS,
+}
+
+
+def as_tuples(events) -> list[tuple]:
+    return [
+        (event.kind, event.timestamp, event.value, event.index, event.field) for event in events
+    ]
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"], ids=["LF", "CRLF"])
+@pytest.mark.parametrize("name", list(FIXTURES))
+@pytest.mark.parametrize("final_newline", [True, False], ids=["final-newline", "no-final-newline"])
+def test_byte_matching_matches_str_era_events(name, newline, final_newline):
+    content = newline.join(FIXTURES[name]) + (newline if final_newline else b"")
+
+    assert as_tuples(match_log_content(content)) == EXPECTED[name]
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"], ids=["LF", "CRLF"])
+def test_content_and_line_matching_agree(newline):
+    lines = ROUND + NON_ASCII + INVALID_UTF8 + SEVERAL_MARKERS
+    content = newline.join(lines)
+
+    by_line = [event for line in lines for event in match_log_line(line + newline)]
+
+    assert as_tuples(match_log_content(content)) == as_tuples(by_line)
+
+
+def test_value_types():
+    events = as_tuples(match_log_content(b"\n".join(ROUND)))
+
+    assert [type(value) for _kind, _timestamp, value, _index, _field in events] == [
+        type(None),
+        str,
+        int,
+        str,
+        int,
+        bool,
+        type(None),
+    ]
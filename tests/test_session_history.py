@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from Modules.core import SessionHistory
+
+
+def test_read_only_queries_handle_uri_characters(tmp_path, monkeypatch):
+    folder = tmp_path / "we?ird #dir%20"
+    folder.mkdir()
+    monkeypatch.chdir(folder)
+
+    history = SessionHistory(Path("history #1?.sqlite3"))
+    history.start_round("output_log_a.txt", 20240501210000)
+    history.close()
+
+    history = SessionHistory(Path("history #1?.sqlite3"))
+    try:
+        assert [row["started_at"] for row in history.rounds()] == [20240501210000]
+        assert history.checkpoints() == {}
+    finally:
+        history.close()